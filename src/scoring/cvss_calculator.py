@@ -5,6 +5,222 @@ Implements the CVSS v4.0 calculation system using MacroVectors and interpolation
 as defined in the CVSS v4.0 specification.
 """
 
+import functools
+import logging
+import re
+from collections import Counter
+from operator import itemgetter, sub
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Metrics in vector string order: the mandatory Base metrics, then the optional ones
+_MANDATORY_ORDER = ('AV', 'AC', 'AT', 'PR', 'UI', 'VC', 'VI', 'VA', 'SC', 'SI', 'SA')
+_OPTIONAL_ORDER = ('E', 'CR', 'IR', 'AR', 'MSI', 'MSA')
+
+# Metrics that determine the base score, in the order used to key the score cache
+_SCORE_METRICS = _MANDATORY_ORDER + _OPTIONAL_ORDER
+_score_key = itemgetter(*_SCORE_METRICS)
+
+# Position of each metric in the compact, encoded metric form
+_METRIC_IDX = {metric: index for index, metric in enumerate(_SCORE_METRICS)}
+_E_IDX = _METRIC_IDX['E']
+
+# Metric ordering from least to most severe, flattened to (metric, value) -> rank
+_SEVERITY_ORDERING = {
+    'AV': {'P': 0, 'L': 1, 'A': 2, 'N': 3},
+    'AC': {'H': 0, 'L': 1},
+    'AT': {'P': 0, 'N': 1},
+    'PR': {'H': 0, 'L': 1, 'N': 2},
+    'UI': {'A': 0, 'P': 1, 'N': 2},
+    'VC': {'N': 0, 'L': 1, 'H': 2},
+    'VI': {'N': 0, 'L': 1, 'H': 2},
+    'VA': {'N': 0, 'L': 1, 'H': 2},
+    'SC': {'N': 0, 'L': 1, 'H': 2},
+    'SI': {'N': 0, 'L': 1, 'H': 2, 'S': 3},
+    'SA': {'N': 0, 'L': 1, 'H': 2, 'S': 3},
+    'E': {'U': 0, 'P': 1, 'A': 2}
+}
+_METRIC_KEYS = tuple(_SEVERITY_ORDERING)
+_ORDER = {(metric, value): rank
+          for metric, ranks in _SEVERITY_ORDERING.items()
+          for value, rank in ranks.items()}
+
+# Joint EQ3+EQ6 levels are handled internally as their position in this tuple,
+# which is also their place in the flat MacroVector index
+# eq1 * 90 + eq2 * 45 + eq3_eq6 * 9 + eq4 * 3 + eq5
+_EQ36_LEVELS = ("00", "01", "10", "11", "21")
+_EQ3_EQ6_INDEX = {level: index for index, level in enumerate(_EQ36_LEVELS)}
+
+
+# Optional metrics whose Not Defined value scores the same as leaving them out
+_OPTIONAL_METRICS = frozenset({'E', 'CR', 'IR', 'AR', 'MSI', 'MSA'})
+
+
+def _canonical_vector(vector_string):
+    """
+    Sort metrics by name and drop optional metrics set to X.
+
+    Vectors that repeat a metric are returned unchanged, so that parsing them
+    still applies the last value given (and reports an invalid earlier one).
+    """
+    prefix, *parts = vector_string.split("/")
+    names = [part.split(":", 1)[0] for part in parts]
+    if len(set(names)) != len(names):
+        return vector_string
+    parts = [part for part in parts
+             if not (part.endswith(":X") and part[:-2] in _OPTIONAL_METRICS)]
+    parts.sort(key=lambda part: part.split(":", 1)[0])
+    return "/".join([prefix, *parts])
+
+
+# A well-formed run of /METRIC:VALUE parts, and a single part within it
+_VECTOR_TAIL_RE = re.compile(r"(?:/[A-Z]+:[A-Z]+)*")
+_PART_RE = re.compile(r"/([A-Z]+):([A-Z]+)")
+
+
+def _vector_parts(vector_string):
+    """
+    Split a vector string into (metric, value) pairs, skipping the prefix.
+
+    Well-formed vectors are split with a single regex pass; anything else goes
+    through the part-by-part split so malformed parts are reported in order.
+    """
+    slash = vector_string.find("/")
+    tail = vector_string[slash:] if slash >= 0 else ""
+    if _VECTOR_TAIL_RE.fullmatch(tail):
+        return _PART_RE.findall(tail)
+    return _split_vector_parts(tail)
+
+
+def _split_vector_parts(tail):
+    """Yield (metric, value) pairs from "/"-separated parts, rejecting malformed ones."""
+    for part in tail.split("/")[1:]:
+        try:
+            metric, value = part.split(":")
+        except ValueError:
+            raise ValueError(f"Invalid metric format: {part}")
+        yield metric, value
+
+
+def _macrovector_index(eq1, eq2, eq3_eq6, eq4, eq5):
+    """Pack MacroVector levels into an index into the flat score list."""
+    return eq1 * 90 + eq2 * 45 + eq3_eq6 * 9 + eq4 * 3 + eq5
+
+
+# One level down in each EQ dimension: (name, position in the levels, lowest
+# level, packed index stride). For EQ3+EQ6 the next joint level ("00" -> "01"
+# -> "10" -> "11" -> "21") is simply the next index.
+_LOWER_STEPS = (
+    ('EQ1', 0, 2, 90),
+    ('EQ2', 1, 1, 45),
+    ('EQ3+EQ6', 2, 4, 9),
+    ('EQ4', 3, 2, 3),
+    ('EQ5', 4, 2, 1),
+)
+
+# Small-integer codes for metric values, used for compact and batch representations
+_ENC = {'N': 0, 'L': 1, 'A': 2, 'P': 3, 'H': 4, 'S': 5, 'X': 6, 'M': 7, 'U': 8, None: 9}
+_DEC = {code: value for value, code in _ENC.items()}
+
+# Severity rank of each encoded value for the distance metrics (-1 where unranked),
+# laid out as [metric position in _SCORE_METRICS, value code]
+_RANK_LUT = np.full((len(_SCORE_METRICS), len(_ENC)), -1, dtype=np.int8)
+for (_metric, _value), _rank in _ORDER.items():
+    _RANK_LUT[_SCORE_METRICS.index(_metric), _ENC[_value]] = _rank
+_RANK_COLUMNS = np.array([_SCORE_METRICS.index(metric) for metric in _METRIC_KEYS])
+
+
+def _severity_ranks(encoded):
+    """
+    Map an (N, 17) array of encoded metrics to an (N, 12) array of severity
+    ranks in _METRIC_KEYS order, with -1 for values that carry no rank.
+    """
+    encoded = np.asarray(encoded, dtype=np.intp)
+    return _RANK_LUT[_RANK_COLUMNS, encoded[:, _RANK_COLUMNS]]
+
+
+def _metric_ranks(metrics):
+    """Severity ranks of a metrics dict in _METRIC_KEYS order, -1 where unranked."""
+    return [_ORDER.get((metric, metrics.get(metric)), -1) for metric in _METRIC_KEYS]
+
+
+def _rank_distance(ranks1, ranks2):
+    """
+    Severity distance between two rank lists, the scalar form of _vector_distances.
+
+    Metrics unranked on either side do not contribute.
+    """
+    if -1 in ranks1 or -1 in ranks2:
+        return sum(abs(rank1 - rank2) for rank1, rank2 in zip(ranks1, ranks2)
+                   if rank1 >= 0 and rank2 >= 0)
+    # Every metric is ranked on both sides, so no masking is needed
+    return sum(map(abs, map(sub, ranks1, ranks2)))
+
+
+def _vector_distances(ranks1, ranks2):
+    """
+    Vectorised severity distance between rows of two rank arrays.
+
+    Equivalent to CVSSv4Calculator._calculate_vector_distance applied row by
+    row: metrics unranked on either side do not contribute.
+    """
+    ranks1 = np.asarray(ranks1, dtype=np.int8)
+    ranks2 = np.asarray(ranks2, dtype=np.int8)
+    ranked = (ranks1 >= 0) & (ranks2 >= 0)
+    return np.where(ranked, np.abs(ranks1 - ranks2), 0).sum(axis=-1)
+
+
+def _round_tenths(scores):
+    """
+    Round an array of scores to one decimal place exactly as round(score, 1) does.
+
+    numpy rounds via score * 10, which can land on the wrong side of a tie, so
+    values that are within float error of a tie are rounded by Python instead.
+    """
+    tenths = scores * 10
+    rounded = np.round(tenths) / 10
+    near_tie = np.abs(tenths - np.floor(tenths) - 0.5) < 1e-9
+    if near_tie.any():
+        rounded[near_tie] = [round(score, 1) for score in scores[near_tie].tolist()]
+    return rounded
+
+
+def _interp_core(base_score, vector_distance, macro_vector_depth, lower_scores):
+    """
+    Numeric core of the MacroVector interpolation.
+
+    Args:
+        base_score: Score of the MacroVector
+        vector_distance: Severity distance from the MacroVector's highest severity vector
+        macro_vector_depth: Maximum severity distance within the MacroVector
+        lower_scores: Scores of the next lower MacroVectors
+
+    Returns:
+        float: Interpolated score clamped to [0, 10]
+    """
+    # Skip interpolation if already at highest severity
+    if vector_distance == 0:
+        return base_score
+
+    # Calculate proportion of distance
+    proportion = vector_distance / macro_vector_depth if macro_vector_depth > 0 else 0
+
+    if lower_scores:
+        # Take mean of the proportional distances to each lower MacroVector
+        adjustment = 0.0
+        for lower_score in lower_scores:
+            adjustment += proportion * (base_score - lower_score)
+        adjusted_score = base_score - adjustment / len(lower_scores)
+    else:
+        # Default adjustment if no lower MacroVector
+        adjusted_score = base_score - (proportion * 1.0)
+
+    # Ensure score within bounds
+    return max(0.0, min(adjusted_score, 10.0))
+
+
 class CVSSv4Calculator:
 
     # Base metrics possible values
@@ -40,64 +256,9 @@ class CVSSv4Calculator:
 
     # Definitions of MacroVectors for EQ1
     EQ1_LEVEL_0 = {'AV': AV_NETWORK, 'PR': PR_NONE, 'UI': UI_NONE}
-    EQ1_LEVEL_1_CONSTRAINTS = [
-        # (AV:N or PR:N or UI:N) and not (AV:N and PR:N and UI:N) and not AV:P
-        lambda av, pr, ui: ((av == 'N' or pr == 'N' or ui == 'N') and
-                            not (av == 'N' and pr == 'N' and ui == 'N') and
-                            not av == 'P')
-    ]
-    EQ1_LEVEL_2_CONSTRAINTS = [
-        # AV:P or not(AV:N or PR:N or UI:N)
-        lambda av, pr, ui: (av == 'P' or
-                            not (av == 'N' or pr == 'N' or ui == 'N'))
-    ]
 
     # Definitions of MacroVectors for EQ2
     EQ2_LEVEL_0 = {'AC': AC_LOW, 'AT': AT_NONE}
-    EQ2_LEVEL_1_CONSTRAINTS = [
-        # not (AC:L and AT:N)
-        lambda ac, at: not (ac == 'L' and at == 'N')
-    ]
-
-    # Definitions of MacroVectors for EQ3
-    EQ3_LEVEL_0_CONSTRAINTS = [
-        # VC:H and VI:H
-        lambda vc, vi, va: (vc == 'H' and vi == 'H')
-    ]
-    EQ3_LEVEL_1_CONSTRAINTS = [
-        # not (VC:H and VI:H) and (VC:H or VI:H or VA:H)
-        lambda vc, vi, va: (not (vc == 'H' and vi == 'H') and
-                            (vc == 'H' or vi == 'H' or va == 'H'))
-    ]
-    EQ3_LEVEL_2_CONSTRAINTS = [
-        # not (VC:H or VI:H or VA:H)
-        lambda vc, vi, va: not (vc == 'H' or vi == 'H' or va == 'H')
-    ]
-
-    # Definitions of MacroVectors for EQ4
-    EQ4_LEVEL_0_CONSTRAINTS = [
-        # MSI:S or MSA:S - Default to SI:H and SA:H if not modified
-        lambda sc, si, sa, msi=None, msa=None: (
-                (msi == 'S' if msi else False) or
-                (msa == 'S' if msa else False)
-        )
-    ]
-    EQ4_LEVEL_1_CONSTRAINTS = [
-        # not (MSI:S or MSA:S) and (SC:H or SI:H or SA:H)
-        lambda sc, si, sa, msi=None, msa=None: (
-                not ((msi == 'S' if msi else False) or
-                     (msa == 'S' if msa else False)) and
-                (sc == 'H' or si == 'H' or sa == 'H')
-        )
-    ]
-    EQ4_LEVEL_2_CONSTRAINTS = [
-        # not (MSI:S or MSA:S) and not (SC:H or SI:H or SA:H)
-        lambda sc, si, sa, msi=None, msa=None: (
-                not ((msi == 'S' if msi else False) or
-                     (msa == 'S' if msa else False)) and
-                not (sc == 'H' or si == 'H' or sa == 'H')
-        )
-    ]
 
     # Definitions of MacroVectors for EQ5
     EQ5_LEVEL_0 = {'E': E_ATTACKED}
@@ -107,73 +268,26 @@ class CVSSv4Calculator:
     # Default X to A for E
     EQ5_DEFAULT = {'E': E_ATTACKED}
 
-    # Definitions for EQ6 (Environmental impact)
-    EQ6_LEVEL_0_CONSTRAINTS = [
-        # (CR:H and VC:H) or (IR:H and VI:H) or (AR:H and VA:H)
-        lambda vc, vi, va, cr, ir, ar: (
-            (cr == 'H' and vc == 'H') or
-            (ir == 'H' and vi == 'H') or
-            (ar == 'H' and va == 'H')
-        )
-    ]
-    EQ6_LEVEL_1_CONSTRAINTS = [
-        # not (CR:H and VC:H) and not (IR:H and VI:H) and not (AR:H and VA:H)
-        lambda vc, vi, va, cr, ir, ar: (
-            not (cr == 'H' and vc == 'H') and
-            not (ir == 'H' and vi == 'H') and
-            not (ar == 'H' and va == 'H')
-        )
-    ]
-
-    # Joint EQ3+EQ6 MacroVector combinations
-    # These determine the 5 possible combinations as described in Table 30
-    EQ3EQ6_LEVEL_00_CONSTRAINTS = [
-        # VC:H and VI:H and [CR:H or IR:H or (AR:H and VA:H)]
-        lambda vc, vi, va, cr, ir, ar: (
-            vc == 'H' and vi == 'H' and
-            (cr == 'H' or ir == 'H' or (ar == 'H' and va == 'H'))
-        )
-    ]
-    EQ3EQ6_LEVEL_01_CONSTRAINTS = [
-        # VC:H and VI:H and not (CR:H or IR:H) and not (AR:H and VA:H)
-        lambda vc, vi, va, cr, ir, ar: (
-            vc == 'H' and vi == 'H' and
-            not (cr == 'H' or ir == 'H') and
-            not (ar == 'H' and va == 'H')
-        )
-    ]
-    EQ3EQ6_LEVEL_10_CONSTRAINTS = [
-        # not (VC:H and VI:H) and (VC:H or VI:H or VA:H) and
-        # [(CR:H and VC:H) or (IR:H and VI:H) or (AR:H and VA:H)]
-        lambda vc, vi, va, cr, ir, ar: (
-            not (vc == 'H' and vi == 'H') and
-            (vc == 'H' or vi == 'H' or va == 'H') and
-            ((cr == 'H' and vc == 'H') or
-             (ir == 'H' and vi == 'H') or
-             (ar == 'H' and va == 'H'))
-        )
-    ]
-    EQ3EQ6_LEVEL_11_CONSTRAINTS = [
-        # not (VC:H and VI:H) and (VC:H or VI:H or VA:H) and
-        # not (CR:H and VC:H) and not (IR:H and VI:H) and not (AR:H and VA:H)
-        lambda vc, vi, va, cr, ir, ar: (
-            not (vc == 'H' and vi == 'H') and
-            (vc == 'H' or vi == 'H' or va == 'H') and
-            not (cr == 'H' and vc == 'H') and
-            not (ir == 'H' and vi == 'H') and
-            not (ar == 'H' and va == 'H')
-        )
-    ]
-    EQ3EQ6_LEVEL_21_CONSTRAINTS = [
-        # not (VC:H or VI:H or VA:H) and
-        # not (CR:H and VC:H) and not (IR:H and VI:H) and not (AR:H and VA:H)
-        lambda vc, vi, va, cr, ir, ar: (
-            not (vc == 'H' or vi == 'H' or va == 'H') and
-            not (cr == 'H' and vc == 'H') and
-            not (ir == 'H' and vi == 'H') and
-            not (ar == 'H' and va == 'H')
-        )
-    ]
+    # Accepted values for each metric when parsing vector strings
+    _VALID_VALUES = {
+        'AV': frozenset('NALP'),
+        'AC': frozenset('LH'),
+        'AT': frozenset('NP'),
+        'PR': frozenset('NLH'),
+        'UI': frozenset('NPA'),
+        'VC': frozenset('HLN'),
+        'VI': frozenset('HLN'),
+        'VA': frozenset('HLN'),
+        'SC': frozenset('HLN'),
+        'SI': frozenset('HLNS'),
+        'SA': frozenset('HLNS'),
+        'E': frozenset('XAPU'),
+        'CR': frozenset('XHML'),
+        'IR': frozenset('XHML'),
+        'AR': frozenset('XHML'),
+        'MSI': frozenset('XHLNS'),
+        'MSA': frozenset('XHLNS'),
+    }
 
     # Complete MacroVector scores lookup based on the official reference implementation
     # Key format: 6-digit string where each digit represents:
@@ -240,6 +354,10 @@ class CVSSv4Calculator:
         "212201": 1.0, "212211": 0.3, "212221": 0.1
     }
 
+    # Instances only carry the metrics dict and a cached vector string;
+    # everything else lives on the class
+    __slots__ = ('metrics', '_vector_cache')
+
     def __init__(self):
         """Initialise the CVSS v4.0 calculator with empty metrics."""
         # Base metrics
@@ -272,19 +390,13 @@ class CVSSv4Calculator:
             'MSA': None,  # Modified Subsequent System Availability
         }
 
+        # (metric values, vector string) from the last to_vector_string call
+        self._vector_cache = None
+
     def set_base_metrics(self, av, ac, at, pr, ui, vc, vi, va, sc, si, sa):
         """Set all Base metrics at once."""
-        self.metrics['AV'] = av
-        self.metrics['AC'] = ac
-        self.metrics['AT'] = at
-        self.metrics['PR'] = pr
-        self.metrics['UI'] = ui
-        self.metrics['VC'] = vc
-        self.metrics['VI'] = vi
-        self.metrics['VA'] = va
-        self.metrics['SC'] = sc
-        self.metrics['SI'] = si
-        self.metrics['SA'] = sa
+        self.metrics.update(AV=av, AC=ac, AT=at, PR=pr, UI=ui,
+                            VC=vc, VI=vi, VA=va, SC=sc, SI=si, SA=sa)
         return self
 
     def set_threat_metrics(self, e):
@@ -306,50 +418,48 @@ class CVSSv4Calculator:
             self.metrics['MSA'] = msa
         return self
 
-    def get_eq1_level(self):
-        """Determine EQ1 level based on AV, PR, UI."""
-        av = self.metrics['AV']
-        pr = self.metrics['PR']
-        ui = self.metrics['UI']
+    def encode_metrics(self):
+        """
+        Encode the current metrics as small integers.
 
-        # Check exact match for level 0
-        if av == self.AV_NETWORK and pr == self.PR_NONE and ui == self.UI_NONE:
-            return 0
+        Returns:
+            bytes: One code per metric, in _SCORE_METRICS order
+        """
+        return bytes(map(_ENC.__getitem__, _score_key(self.metrics)))
 
-        # Check level 1 constraints
-        for constraint in self.EQ1_LEVEL_1_CONSTRAINTS:
-            if constraint(av, pr, ui):
-                return 1
+    @classmethod
+    def from_encoded_metrics(cls, encoded):
+        """Create a calculator from metrics produced by encode_metrics()."""
+        calculator = cls()
+        calculator.metrics.update(zip(_SCORE_METRICS, map(_DEC.__getitem__, encoded)))
+        return calculator
 
-        # Must be level 2
-        return 2
+    def get_eq1_level(self):
+        """Determine EQ1 level based on AV, PR, UI."""
+        m = self.metrics
+        key = (m['AV'], m['PR'], m['UI'])
+        try:
+            return self._EQ1_TABLE[key]
+        except KeyError:
+            # Values outside the specification fall back to the constraint logic
+            return _eq1_level(*key)
 
     def get_eq2_level(self):
         """Determine EQ2 level based on AC, AT."""
-        ac = self.metrics['AC']
-        at = self.metrics['AT']
-
-        # Check exact match for level 0
-        if ac == self.AC_LOW and at == self.AT_NONE:
-            return 0
-
-        # Must be level 1
-        return 1
+        m = self.metrics
+        key = (m['AC'], m['AT'])
+        try:
+            return self._EQ2_TABLE[key]
+        except KeyError:
+            return _eq2_level(*key)
 
     def get_eq5_level(self):
         """Determine EQ5 level based on E."""
         e = self.metrics['E']
-
-        # Default X to A
-        if e == self.E_NOT_DEFINED:
-            e = self.E_ATTACKED
-
-        if e == self.E_ATTACKED:
-            return 0
-        elif e == self.E_POC:
-            return 1
-        else:  # E_UNREPORTED
-            return 2
+        try:
+            return self._EQ5_TABLE[e]
+        except KeyError:
+            return _eq5_level(e)
         
     def get_eq3_eq6_joint_level(self):
         """
@@ -360,50 +470,16 @@ class CVSSv4Calculator:
         Returns:
             str: Two-digit string for joint EQ3+EQ6 level (00, 01, 10, 11, 21)
         """
-        # Get values of relevant metrics
-        vc = self.metrics['VC']
-        vi = self.metrics['VI']
-        va = self.metrics['VA']
-        
-        # Get environmental requirements
-        cr = self.metrics.get('CR', 'H')  # Default Confidentiality Requirement
-        ir = self.metrics.get('IR', 'H')  # Default Integrity Requirement
-        ar = self.metrics.get('AR', 'H')  # Default Availability Requirement
-        
-        # Handle 'X' defaults to 'H'
-        if cr == 'X': cr = 'H'
-        if ir == 'X': ir = 'H'
-        if ar == 'X': ar = 'H'
-        
-        # Check Level 00 
-        if (vc == 'H' and vi == 'H' and 
-            (cr == 'H' or ir == 'H' or (ar == 'H' and va == 'H'))):
-            return "00"
-        
-        # Check Level 01
-        if (vc == 'H' and vi == 'H' and 
-            not (cr == 'H' or ir == 'H') and 
-            not (ar == 'H' and va == 'H')):
-            return "01"
-        
-        # Check Level 10
-        if (not (vc == 'H' and vi == 'H') and 
-            (vc == 'H' or vi == 'H' or va == 'H') and 
-            ((cr == 'H' and vc == 'H') or 
-            (ir == 'H' and vi == 'H') or 
-            (ar == 'H' and va == 'H'))):
-            return "10"
-        
-        # Check Level 11
-        if (not (vc == 'H' and vi == 'H') and 
-            (vc == 'H' or vi == 'H' or va == 'H') and 
-            not (cr == 'H' and vc == 'H') and 
-            not (ir == 'H' and vi == 'H') and 
-            not (ar == 'H' and va == 'H')):
-            return "11"
-        
-        # Default to Level 21
-        return "21"
+        return _EQ36_LEVELS[self._get_eq3_eq6_joint_index()]
+
+    def _get_eq3_eq6_joint_index(self):
+        """Determine the joint EQ3+EQ6 level as its index into _EQ36_LEVELS."""
+        m = self.metrics
+        key = (m['VC'], m['VI'], m['VA'], m.get('CR', 'H'), m.get('IR', 'H'), m.get('AR', 'H'))
+        try:
+            return self._EQ3_EQ6_TABLE[key]
+        except KeyError:
+            return _eq3_eq6_joint_level(*_requirements_as_h(key))
 
     def get_eq3_level(self):
         """
@@ -414,21 +490,12 @@ class CVSSv4Calculator:
         Returns:
             int: EQ3 level (0, 1, or 2)
         """
-        vc = self.metrics['VC']
-        vi = self.metrics['VI']
-        va = self.metrics['VA']
-        
-        # Level 0: VC:H and VI:H
-        if vc == 'H' and vi == 'H':
-            return 0
-        
-        # Level 1: not (VC:H and VI:H) and (VC:H or VI:H or VA:H)
-        if (not (vc == 'H' and vi == 'H') and 
-            (vc == 'H' or vi == 'H' or va == 'H')):
-            return 1
-        
-        # Level 2: not (VC:H or VI:H or VA:H)
-        return 2
+        m = self.metrics
+        key = (m['VC'], m['VI'], m['VA'])
+        try:
+            return self._EQ3_TABLE[key]
+        except KeyError:
+            return _eq3_level(*key)
 
     def get_eq4_level(self):
         """
@@ -437,25 +504,12 @@ class CVSSv4Calculator:
         Returns:
             int: EQ4 level (0, 1, or 2)
         """
-        sc = self.metrics['SC']
-        si = self.metrics['SI']
-        sa = self.metrics['SA']
-        
-        # Get modified metrics
-        msi = self.metrics.get('MSI')
-        msa = self.metrics.get('MSA')
-        
-        # Level 0: MSI:S or MSA:S
-        if msi == 'S' or msa == 'S' or si == 'S' or sa == 'S':  # Check SI and SA too!
-            return 0
-        
-        # Level 1: not (MSI:S or MSA:S) and (SC:H or SI:H or SA:H)
-        if (not (msi == 'S' or msa == 'S' or si == 'S' or sa == 'S') and 
-            (sc == 'H' or si == 'H' or sa == 'H')):
-            return 1
-        
-        # Level 2: not (MSI:S or MSA:S) and not (SC:H or SI:H or SA:H)
-        return 2
+        m = self.metrics
+        key = (m['SC'], m['SI'], m['SA'], m.get('MSI'), m.get('MSA'))
+        try:
+            return self._EQ4_TABLE[key]
+        except KeyError:
+            return _eq4_level(*key)
 
     def get_eq6_level(self):
         """
@@ -466,57 +520,83 @@ class CVSSv4Calculator:
         Returns:
             int: EQ6 level (0 or 1)
         """
-        vc = self.metrics['VC']
-        vi = self.metrics['VI']
-        va = self.metrics['VA']
-        
-        # Get environmental requirements
-        cr = self.metrics.get('CR', 'H')  # Default Confidentiality Requirement
-        ir = self.metrics.get('IR', 'H')  # Default Integrity Requirement
-        ar = self.metrics.get('AR', 'H')  # Default Availability Requirement
-        
-        # Handle 'X' defaults to 'H'
-        if cr == 'X': cr = 'H'
-        if ir == 'X': ir = 'H'
-        if ar == 'X': ar = 'H'
-        
-        # Level 0: (CR:H and VC:H) or (IR:H and VI:H) or (AR:H and VA:H)
-        if ((cr == 'H' and vc == 'H') or 
-            (ir == 'H' and vi == 'H') or 
-            (ar == 'H' and va == 'H')):
-            return 0
-        
-        # Level 1
-        return 1
+        m = self.metrics
+        key = (m['VC'], m['VI'], m['VA'], m.get('CR', 'H'), m.get('IR', 'H'), m.get('AR', 'H'))
+        try:
+            return self._EQ6_TABLE[key]
+        except KeyError:
+            return _eq6_level(*_requirements_as_h(key))
+
+    def get_macrovector_levels(self):
+        """
+        Determine the levels of every equivalence class in a single pass.
+
+        Reads the metrics once and resolves each level from the precomputed
+        tables, rather than calling each get_eqN_level getter in turn.
+
+        Returns:
+            tuple: (eq1, eq2, eq3_eq6, eq4, eq5) levels, with the joint
+                EQ3+EQ6 level as its index into _EQ36_LEVELS
+        """
+        m = self.metrics
+        cr, ir, ar = m.get('CR', 'H'), m.get('IR', 'H'), m.get('AR', 'H')
+        try:
+            return (
+                self._EQ1_TABLE[(m['AV'], m['PR'], m['UI'])],
+                self._EQ2_TABLE[(m['AC'], m['AT'])],
+                self._EQ3_EQ6_TABLE[(m['VC'], m['VI'], m['VA'], cr, ir, ar)],
+                self._EQ4_TABLE[(m['SC'], m['SI'], m['SA'], m.get('MSI'), m.get('MSA'))],
+                self._EQ5_TABLE[m['E']],
+            )
+        except KeyError:
+            # Values outside the specification fall back to the constraint logic
+            return (self.get_eq1_level(), self.get_eq2_level(), self._get_eq3_eq6_joint_index(),
+                    self.get_eq4_level(), self.get_eq5_level())
 
     def calculate_base_score(self):
+        m = self.metrics
         # Ensure required Base metrics are set
-        for metric in ['AV', 'AC', 'AT', 'PR', 'UI', 'VC', 'VI', 'VA', 'SC', 'SI', 'SA']:
-            if self.metrics[metric] is None:
+        for metric in _MANDATORY_ORDER:
+            if m[metric] is None:
                 raise ValueError(f"Metric {metric} must be set before calculating the score")
 
         # Default E to X if not set, equivalent to A (Attacked)
-        if self.metrics['E'] is None or self.metrics['E'] == self.E_NOT_DEFINED:
-            self.metrics['E'] = self.E_ATTACKED
+        e = m['E']
+        if e is None or e == self.E_NOT_DEFINED:
+            m['E'] = self.E_ATTACKED
 
+        return self._score_for(*_score_key(m))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _score_for(*metric_values):
+        """
+        Score a metric combination, memoised on the tuple of metric values.
+
+        The score is a pure function of the metrics, so repeated vectors are
+        answered from the cache without recomputing levels or interpolation.
+        """
+        calculator = CVSSv4Calculator()
+        calculator.metrics.update(zip(_SCORE_METRICS, metric_values))
+        return calculator._calculate_base_score()
+
+    def _calculate_base_score(self):
+        """Compute the rounded base score from the current metrics."""
         # Determine levels for each equivalence class
-        eq1 = self.get_eq1_level()
-        eq2 = self.get_eq2_level()
-        eq3_eq6 = self.get_eq3_eq6_joint_level()
-        eq4 = self.get_eq4_level()
-        eq5 = self.get_eq5_level()
+        eq1, eq2, eq3_eq6, eq4, eq5 = self.get_macrovector_levels()
 
-        # Debug info
-        #print(f"Debug - Levels: EQ1:{eq1}, EQ2:{eq2}, EQ3+EQ6:{eq3_eq6}, EQ4:{eq4}, EQ5:{eq5}") 
-        macro_vector_key = f"{eq1}{eq2}{eq3_eq6}{eq4}{eq5}"
-        #print(f"Debug - MacroVector Key: {macro_vector_key}")
+        macro_vector_index = _macrovector_index(eq1, eq2, eq3_eq6, eq4, eq5)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Levels: EQ1:%s, EQ2:%s, EQ3+EQ6:%s, EQ4:%s, EQ5:%s",
+                         eq1, eq2, _EQ36_LEVELS[eq3_eq6], eq4, eq5)
+            logger.debug("MacroVector Index: %s", macro_vector_index)
 
         # Look up score from MacroVector
-        if macro_vector_key in self.MACROVECTOR_SCORES:
-            score = self.MACROVECTOR_SCORES[macro_vector_key]
-            #print(f"Debug - Score from lookup: {score}")
-        else:
-            #print(f"Debug - Key {macro_vector_key} not found in lookup table")
+        score = self._MACROVECTOR_SCORE_LIST[macro_vector_index]
+        if score is None:
+            if debug:
+                logger.debug("Index %s not found in lookup table", macro_vector_index)
             # Fallback if key not found
             score = 5.0  # Default midpoint
 
@@ -525,6 +605,137 @@ class CVSSv4Calculator:
 
         # Return final score rounded to one decimal place
         return round(score, 1)
+
+    @staticmethod
+    def calculate_scores_batch(encoded):
+        """
+        Calculate base scores for many vectors at once.
+        
+        Vectorised equivalent of calculate_base_score over metrics encoded as
+        by encode_metrics(), giving identical scores without building a
+        calculator per vector.
+        
+        Args:
+            encoded: (N, 17) integer array, one row of metric codes per vector,
+                or a sequence of encode_metrics() bytes
+            
+        Returns:
+            numpy.ndarray: (N,) array of CVSS v4.0 base scores
+        """
+        if isinstance(encoded, (bytes, bytearray)):
+            encoded = [encoded]
+        if len(encoded) and isinstance(encoded[0], (bytes, bytearray)):
+            if any(len(row) != len(_SCORE_METRICS) for row in encoded):
+                raise ValueError(f"Expected {len(_SCORE_METRICS)} metric codes per row")
+            encoded = np.frombuffer(b"".join(encoded), dtype=np.uint8).reshape(-1, len(_SCORE_METRICS))
+        m = np.array(encoded, dtype=np.intp, ndmin=2)
+        if m.shape[1] != len(_SCORE_METRICS):
+            raise ValueError(f"Expected {len(_SCORE_METRICS)} metric columns, got {m.shape[1]}")
+
+        # Ensure required Base metrics are set
+        unset = m[:, :len(_MANDATORY_ORDER)] == _ENC[None]
+        if unset.any():
+            metric = _SCORE_METRICS[int(np.nonzero(unset.any(axis=0))[0][0])]
+            raise ValueError(f"Metric {metric} must be set before calculating the score")
+
+        # Default E to A (Attacked) when not set or X
+        e = m[:, _E_IDX]
+        e[(e == _ENC[None]) | (e == _ENC['X'])] = _ENC['A']
+
+        eq1, eq2, eq3_eq6, eq4, eq5 = CVSSv4Calculator._levels_batch(m)
+        index = eq1 * 90 + eq2 * 45 + eq3_eq6 * 9 + eq4 * 3 + eq5
+        base_score = CVSSv4Calculator._MACROVECTOR_SCORE_ARRAY[index]
+        # Fallback if key not found
+        base_score = np.where(np.isnan(base_score), 5.0, base_score)
+        scores = CVSSv4Calculator._interpolate_batch(m, index)
+
+        # Special cases for the highest severity MacroVectors
+        near_highest = ((eq1 == 0) & (eq2 == 0) & (eq3_eq6 <= 1) &
+                        (eq4 <= 1) & (eq5 == 0))
+        scores = np.where(near_highest, np.maximum(base_score, 9.8), scores)
+        scores = np.where(index == 0, 10.0, scores)
+
+        return _round_tenths(scores)
+
+    @staticmethod
+    def compute_interpolated_scores_batch(vectors):
+        """
+        Compute interpolated scores for many vector strings at once.
+        
+        Each vector is interpolated within its own MacroVector, as
+        compute_interpolated_score does for a single vector, with the
+        arithmetic done over the whole batch. Repeated strings are parsed once.
+        
+        Args:
+            vectors: Iterable of CVSS v4.0 vector strings
+            
+        Returns:
+            numpy.ndarray: (N,) array of interpolated scores
+        """
+        vectors = list(vectors)
+        rows = {}
+        for vector in vectors:
+            if vector not in rows:
+                metrics = CVSSv4Calculator.from_vector_string(vector).metrics
+                try:
+                    rows[vector] = [_ENC[metrics[metric]] for metric in _SCORE_METRICS]
+                except KeyError as e:
+                    raise ValueError(f"Unsupported metric value {e} in {vector}")
+        m = np.array([rows[vector] for vector in vectors], dtype=np.intp).reshape(-1, len(_SCORE_METRICS))
+
+        # Default E to A (Attacked) when not set, as calculate_base_score does
+        e = m[:, _E_IDX]
+        e[e == _ENC[None]] = _ENC['A']
+
+        eq1, eq2, eq3_eq6, eq4, eq5 = CVSSv4Calculator._levels_batch(m)
+        index = eq1 * 90 + eq2 * 45 + eq3_eq6 * 9 + eq4 * 3 + eq5
+        base_score = CVSSv4Calculator._MACROVECTOR_SCORE_ARRAY[index]
+        scores = CVSSv4Calculator._interpolate_batch(m, index)
+
+        # Undefined MacroVectors score the default midpoint without interpolation
+        return np.where(np.isnan(base_score), 5.0, scores)
+
+    @staticmethod
+    def _levels_batch(m):
+        """Determine the EQ levels of every row of an (N, 17) encoded metric array."""
+        av, ac, at, pr, ui, vc, vi, va, sc, si, sa, e, cr, ir, ar, msi, msa = m.T
+        N, L, P, H, S, X = _ENC['N'], _ENC['L'], _ENC['P'], _ENC['H'], _ENC['S'], _ENC['X']
+
+        # EQ1: AV, PR, UI
+        any_n = (av == N) | (pr == N) | (ui == N)
+        all_n = (av == N) & (pr == N) & (ui == N)
+        eq1 = np.where(all_n, 0, np.where(any_n & (av != P), 1, 2))
+
+        # EQ2: AC, AT
+        eq2 = np.where((ac == L) & (at == N), 0, 1)
+
+        # Joint EQ3+EQ6: VC, VI, VA with requirements, X counting as H
+        vc_h, vi_h, va_h = vc == H, vi == H, va == H
+        cr_h = (cr == H) | (cr == X)
+        ir_h = (ir == H) | (ir == X)
+        ar_h = (ar == H) | (ar == X)
+        both_h = vc_h & vi_h
+        any_h = vc_h | vi_h | va_h
+        eq6_0 = (cr_h & vc_h) | (ir_h & vi_h) | (ar_h & va_h)
+        eq3_eq6 = np.select(
+            [both_h & (cr_h | ir_h | (ar_h & va_h)), both_h, any_h & eq6_0, any_h],
+            [0, 1, 2, 3], 4)
+
+        # EQ4: SC, SI, SA with MSI, MSA
+        safety = (msi == S) | (msa == S) | (si == S) | (sa == S)
+        eq4 = np.where(safety, 0, np.where((sc == H) | (si == H) | (sa == H), 1, 2))
+
+        # EQ5: E, X counting as A
+        eq5 = np.where((e == _ENC['A']) | (e == X), 0, np.where(e == P, 1, 2))
+
+        return eq1, eq2, eq3_eq6, eq4, eq5
+
+    @staticmethod
+    def _interpolate_batch(m, index):
+        """Look up each row's interpolated score by MacroVector and severity distance."""
+        vector_distance = _vector_distances(_severity_ranks(m),
+                                            CVSSv4Calculator._HIGHEST_RANK_ARRAY[index])
+        return CVSSv4Calculator._INTERPOLATED_ARRAY[index, vector_distance]
     
     def _find_closest_macrovector_keys(self, target_key):
         """
@@ -532,19 +743,18 @@ class CVSSv4Calculator:
         
         Helper method for edge cases with missing keys.
         """
-        # Find keys matching in most positions
-        closest_keys = []
-        best_match_count = 0
-        
-        for key in self.MACROVECTOR_SCORES.keys():
-            match_count = sum(1 for a, b in zip(key, target_key) if a == b)
-            if match_count > best_match_count:
-                closest_keys = [key]
-                best_match_count = match_count
-            elif match_count == best_match_count:
-                closest_keys.append(key)
-                
-        return closest_keys
+        # Count matching positions per key using the positional index
+        match_counts = Counter()
+        for position, char in enumerate(target_key[:6]):
+            match_counts.update(self._POSITION_INDEX[position].get(char, ()))
+
+        # With no matching position anywhere every key is equally close
+        if not match_counts:
+            return list(self.MACROVECTOR_SCORES)
+
+        best_match_count = max(match_counts.values())
+        closest_keys = [key for key, count in match_counts.items() if count == best_match_count]
+        return sorted(closest_keys, key=self._MACROVECTOR_ORDER.__getitem__)
     
     def _apply_interpolation(self, base_score, eq1, eq2, eq3_eq6, eq4, eq5):
         """
@@ -553,56 +763,19 @@ class CVSSv4Calculator:
         Special handling for highest severity scenarios to ensure 10.0 score.
         """
         # Special case for absolute highest severity
-        if (eq1 == 0 and eq2 == 0 and eq3_eq6 == "00" and eq4 == 0 and eq5 == 0):
+        if (eq1 == 0 and eq2 == 0 and eq3_eq6 == 0 and eq4 == 0 and eq5 == 0):
             return 10.0
         
         # Special case for near-highest severity
-        if (eq1 == 0 and eq2 == 0 and eq3_eq6 in ["00", "01"] and eq4 <= 1 and eq5 == 0):
+        if (eq1 == 0 and eq2 == 0 and eq3_eq6 <= 1 and eq4 <= 1 and eq5 == 0):
             return max(base_score, 9.8)
         
-        # Find highest severity vector for this MacroVector
-        highest_vector = self._find_highest_severity_vector(eq1, eq2, eq3_eq6, eq4, eq5)
-        
-        # Calculate severity distance from highest severity
-        vector_distance = self._calculate_vector_distance(self.metrics, highest_vector)
-        
-        # Skip interpolation if already at highest severity
-        if vector_distance == 0:
-            return base_score
-        
-        # Calculate MacroVector depth (maximum possible severity distance)
-        macro_vector_depth = self._get_macrovector_depth(eq1, eq2, eq3_eq6, eq4, eq5)
-        
-        # Calculate proportion of distance
-        proportion = vector_distance / macro_vector_depth if macro_vector_depth > 0 else 0
-        
-        # Find next lower MacroVector scores
-        lower_scores = self._find_lower_macrovector_scores(eq1, eq2, eq3_eq6, eq4, eq5)
-        
-        # Apply interpolation based on available lower scores
-        if lower_scores:
-            # Calculate mean of proportional distances
-            score_adjustments = []
-            
-            for eq_name, lower_score in lower_scores.items():
-                score_diff = base_score - lower_score
-                score_adjustments.append(proportion * score_diff)
-            
-            if score_adjustments:
-                # Take mean of adjustments
-                mean_adjustment = sum(score_adjustments) / len(score_adjustments)
-                adjusted_score = base_score - mean_adjustment
-            else:
-                # Default adjustment if no specifics
-                adjusted_score = base_score - (proportion * 1.0)
-        else:
-            # Default adjustment if no lower MacroVector
-            adjusted_score = base_score - (proportion * 1.0)
-        
-        # Ensure score within bounds
-        return max(0.0, min(adjusted_score, 10.0))
-
-    def _calculate_vector_distance(self, vector1, vector2):
+        # Interpolate within the MacroVector from the precomputed tables
+        index = _macrovector_index(eq1, eq2, eq3_eq6, eq4, eq5)
+        return _interpolate(_metric_ranks(self.metrics), index)
+
+    @staticmethod
+    def _calculate_vector_distance(vector1, vector2):
         """
         Calculate severity distance between two vectors.
         
@@ -614,35 +787,7 @@ class CVSSv4Calculator:
         Returns:
             int: Severity distance
         """
-        distance = 0
-        
-        # Define metric ordering from least to most severe
-        ordering = {
-            'AV': {'P': 0, 'L': 1, 'A': 2, 'N': 3},
-            'AC': {'H': 0, 'L': 1},
-            'AT': {'P': 0, 'N': 1},
-            'PR': {'H': 0, 'L': 1, 'N': 2},
-            'UI': {'A': 0, 'P': 1, 'N': 2},
-            'VC': {'N': 0, 'L': 1, 'H': 2},
-            'VI': {'N': 0, 'L': 1, 'H': 2},
-            'VA': {'N': 0, 'L': 1, 'H': 2},
-            'SC': {'N': 0, 'L': 1, 'H': 2},
-            'SI': {'N': 0, 'L': 1, 'H': 2, 'S': 3},
-            'SA': {'N': 0, 'L': 1, 'H': 2, 'S': 3},
-            'E': {'U': 0, 'P': 1, 'A': 2}
-        }
-        
-        # Calculate distance for each metric
-        for metric in ordering:
-            if metric in vector1 and metric in vector2:
-                val1 = vector1[metric]
-                val2 = vector2[metric]
-                
-                if val1 in ordering[metric] and val2 in ordering[metric]:
-                    # Add distance in severity steps
-                    distance += abs(ordering[metric][val1] - ordering[metric][val2])
-                    
-        return distance
+        return _rank_distance(_metric_ranks(vector1), _metric_ranks(vector2))
 
     def _get_macrovector_depth(self, eq1, eq2, eq3_eq6, eq4, eq5):
         """
@@ -656,12 +801,7 @@ class CVSSv4Calculator:
         Returns:
             int: Depth of MacroVector
         """
-        # Find highest and lowest severity vectors
-        highest_vector = self._find_highest_severity_vector(eq1, eq2, eq3_eq6, eq4, eq5)
-        lowest_vector = self._find_lowest_severity_vector(eq1, eq2, eq3_eq6, eq4, eq5)
-        
-        # Calculate distance between them
-        return self._calculate_vector_distance(highest_vector, lowest_vector)
+        return self._DEPTH_LIST[_macrovector_index(eq1, eq2, eq3_eq6, eq4, eq5)]
 
     def _find_highest_severity_vector(self, eq1, eq2, eq3_eq6, eq4, eq5):
         """
@@ -671,8 +811,25 @@ class CVSSv4Calculator:
             eq1, eq2, eq3_eq6, eq4, eq5: Equivalence class levels
             
         Returns:
-            dict: Dictionary representing highest severity vector
+            dict: Dictionary representing highest severity vector (shared, do not modify)
         """
+        return self._HIGHEST_VECTOR_LIST[_macrovector_index(eq1, eq2, eq3_eq6, eq4, eq5)]
+
+    def _find_lowest_severity_vector(self, eq1, eq2, eq3_eq6, eq4, eq5):
+        """
+        Find lowest severity vector in a MacroVector.
+        
+        Args:
+            eq1, eq2, eq3_eq6, eq4, eq5: Equivalence class levels
+            
+        Returns:
+            dict: Dictionary representing lowest severity vector (shared, do not modify)
+        """
+        return self._LOWEST_VECTOR_LIST[_macrovector_index(eq1, eq2, eq3_eq6, eq4, eq5)]
+
+    @staticmethod
+    def _highest_severity_vector(eq1, eq2, eq3_eq6, eq4, eq5):
+        """Build the highest severity vector of a MacroVector."""
         highest_vector = {}
         
         # EQ1 highest severity values
@@ -691,15 +848,15 @@ class CVSSv4Calculator:
             highest_vector.update({'AC': 'L', 'AT': 'P'})
         
         # EQ3+EQ6 joint values
-        if eq3_eq6 == "00":
+        if eq3_eq6 == 0:  # 00
             highest_vector.update({'VC': 'H', 'VI': 'H', 'VA': 'H', 'CR': 'H', 'IR': 'H', 'AR': 'H'})
-        elif eq3_eq6 == "01":
+        elif eq3_eq6 == 1:  # 01
             highest_vector.update({'VC': 'H', 'VI': 'H', 'VA': 'H', 'CR': 'M', 'IR': 'M', 'AR': 'M'})
-        elif eq3_eq6 == "10":
+        elif eq3_eq6 == 2:  # 10
             highest_vector.update({'VC': 'L', 'VI': 'H', 'VA': 'H', 'CR': 'H', 'IR': 'H', 'AR': 'H'})
-        elif eq3_eq6 == "11":
+        elif eq3_eq6 == 3:  # 11
             highest_vector.update({'VC': 'H', 'VI': 'L', 'VA': 'H', 'CR': 'M', 'IR': 'H', 'AR': 'M'})
-        else:  # eq3_eq6 == "21"
+        else:  # 21
             highest_vector.update({'VC': 'L', 'VI': 'L', 'VA': 'L', 'CR': 'H', 'IR': 'H', 'AR': 'H'})
         
         # EQ4 highest severity values
@@ -720,16 +877,9 @@ class CVSSv4Calculator:
         
         return highest_vector
 
-    def _find_lowest_severity_vector(self, eq1, eq2, eq3_eq6, eq4, eq5):
-        """
-        Find lowest severity vector in a MacroVector.
-        
-        Args:
-            eq1, eq2, eq3_eq6, eq4, eq5: Equivalence class levels
-            
-        Returns:
-            dict: Dictionary representing lowest severity vector
-        """
+    @staticmethod
+    def _lowest_severity_vector(eq1, eq2, eq3_eq6, eq4, eq5):
+        """Build the lowest severity vector of a MacroVector."""
         lowest_vector = {}
         
         # EQ1 lowest severity values
@@ -748,15 +898,15 @@ class CVSSv4Calculator:
             lowest_vector.update({'AC': 'H', 'AT': 'P'})
         
         # EQ3+EQ6 joint values
-        if eq3_eq6 == "00":
+        if eq3_eq6 == 0:  # 00
             lowest_vector.update({'VC': 'H', 'VI': 'H', 'VA': 'H', 'CR': 'H', 'IR': 'H', 'AR': 'H'})
-        elif eq3_eq6 == "01":
+        elif eq3_eq6 == 1:  # 01
             lowest_vector.update({'VC': 'H', 'VI': 'H', 'VA': 'L', 'CR': 'L', 'IR': 'L', 'AR': 'L'})
-        elif eq3_eq6 == "10":
+        elif eq3_eq6 == 2:  # 10
             lowest_vector.update({'VC': 'H', 'VI': 'L', 'VA': 'L', 'CR': 'H', 'IR': 'H', 'AR': 'L'})
-        elif eq3_eq6 == "11":
+        elif eq3_eq6 == 3:  # 11
             lowest_vector.update({'VC': 'L', 'VI': 'L', 'VA': 'H', 'CR': 'L', 'IR': 'L', 'AR': 'L'})
-        else:  # eq3_eq6 == "21"
+        else:  # 21
             lowest_vector.update({'VC': 'L', 'VI': 'L', 'VA': 'L', 'CR': 'L', 'IR': 'L', 'AR': 'L'})
         
         # EQ4 lowest severity values
@@ -787,49 +937,22 @@ class CVSSv4Calculator:
         Returns:
             dict: Dictionary mapping EQ dimension names to lower MacroVector scores
         """
+        return self._LOWER_SCORES_LIST[_macrovector_index(eq1, eq2, eq3_eq6, eq4, eq5)]
+
+    @classmethod
+    def _lower_macrovector_scores(cls, eq1, eq2, eq3_eq6, eq4, eq5):
+        """Collect the scores of the next lower MacroVector in each EQ dimension."""
         lower_scores = {}
+        scores = cls._MACROVECTOR_SCORE_LIST
+        levels = (eq1, eq2, eq3_eq6, eq4, eq5)
+        index = _macrovector_index(*levels)
         
-        # Try EQ1 one level down
-        if eq1 < 2:
-            key = f"{eq1+1}{eq2}{eq3_eq6}{eq4}{eq5}"
-            if key in self.MACROVECTOR_SCORES:
-                lower_scores['EQ1'] = self.MACROVECTOR_SCORES[key]
-        
-        # Try EQ2 one level down
-        if eq2 < 1:
-            key = f"{eq1}{eq2+1}{eq3_eq6}{eq4}{eq5}"
-            if key in self.MACROVECTOR_SCORES:
-                lower_scores['EQ2'] = self.MACROVECTOR_SCORES[key]
-        
-        # Try EQ3+EQ6 one level down
-        if eq3_eq6 == "00":
-            key = f"{eq1}{eq2}01{eq4}{eq5}"
-            if key in self.MACROVECTOR_SCORES:
-                lower_scores['EQ3+EQ6'] = self.MACROVECTOR_SCORES[key]
-        elif eq3_eq6 == "01":
-            key = f"{eq1}{eq2}10{eq4}{eq5}"
-            if key in self.MACROVECTOR_SCORES:
-                lower_scores['EQ3+EQ6'] = self.MACROVECTOR_SCORES[key]
-        elif eq3_eq6 == "10":
-            key = f"{eq1}{eq2}11{eq4}{eq5}"
-            if key in self.MACROVECTOR_SCORES:
-                lower_scores['EQ3+EQ6'] = self.MACROVECTOR_SCORES[key]
-        elif eq3_eq6 == "11":
-            key = f"{eq1}{eq2}21{eq4}{eq5}"
-            if key in self.MACROVECTOR_SCORES:
-                lower_scores['EQ3+EQ6'] = self.MACROVECTOR_SCORES[key]
-        
-        # Try EQ4 one level down
-        if eq4 < 2:
-            key = f"{eq1}{eq2}{eq3_eq6}{eq4+1}{eq5}"
-            if key in self.MACROVECTOR_SCORES:
-                lower_scores['EQ4'] = self.MACROVECTOR_SCORES[key]
-        
-        # Try EQ5 one level down
-        if eq5 < 2:
-            key = f"{eq1}{eq2}{eq3_eq6}{eq4}{eq5+1}"
-            if key in self.MACROVECTOR_SCORES:
-                lower_scores['EQ5'] = self.MACROVECTOR_SCORES[key]
+        # Try each EQ dimension one level down
+        for name, position, lowest, stride in _LOWER_STEPS:
+            if levels[position] < lowest:
+                score = scores[index + stride]
+                if score is not None:
+                    lower_scores[name] = score
         
         return lower_scores
     
@@ -837,23 +960,24 @@ class CVSSv4Calculator:
         """
         Convert current metrics to CVSS v4.0 vector string.
         """
-        parts = ["CVSS:4.0"]
+        m = self.metrics
 
-        # Mandatory Base metrics
-        for metric in ['AV', 'AC', 'AT', 'PR', 'UI', 'VC', 'VI', 'VA', 'SC', 'SI', 'SA']:
-            if self.metrics[metric] is not None:
-                parts.append(f"{metric}:{self.metrics[metric]}")
+        # The metrics dict can be changed directly, so the cached string is
+        # only reused while the metric values it was built from are unchanged
+        values = _score_key(m)
+        cached = self._vector_cache
+        if cached is not None and cached[0] == values:
+            return cached[1]
 
-        # Optional Threat metrics
-        if self.metrics['E'] is not None and self.metrics['E'] != self.E_NOT_DEFINED:
-            parts.append(f"E:{self.metrics['E']}")
-            
-        # Optional Environmental metrics
-        for metric in ['CR', 'IR', 'AR', 'MSI', 'MSA']:
-            if metric in self.metrics and self.metrics[metric] is not None:
-                parts.append(f"{metric}:{self.metrics[metric]}")
-
-        return "/".join(parts)
+        # Every metric that is set, in vector order, except E:X which is the default
+        shown = values
+        if values[_E_IDX] == self.E_NOT_DEFINED:
+            shown = values[:_E_IDX] + (None,) + values[_E_IDX + 1:]
+        vector_string = "/".join(["CVSS:4.0", *(f"{metric}:{value}"
+                                                for metric, value in zip(_SCORE_METRICS, shown)
+                                                if value is not None)])
+        self._vector_cache = (values, vector_string)
+        return vector_string
 
     @classmethod
     def from_vector_string(cls, vector_string):
@@ -863,45 +987,50 @@ class CVSSv4Calculator:
         if not vector_string.startswith("CVSS:4.0"):
             raise ValueError("Vector string must start with CVSS:4.0")
 
-        # Validate and parse metrics
-        parts = vector_string.split("/")[1:]  # Skip CVSS:4.0 prefix
-        
-        mandatory_metrics = [
-            'AV', 'AC', 'AT', 'PR', 'UI', 
-            'VC', 'VI', 'VA', 
-            'SC', 'SI', 'SA'
-        ]
         found_metrics = set()
 
-        for part in parts:
-            try:
-                metric, value = part.split(":")
-            except ValueError:
-                raise ValueError(f"Invalid metric format: {part}")
-            
+        # Validate and parse metrics
+        for metric, value in _vector_parts(vector_string):
             # Validate metric and value
             if metric not in calculator.metrics:
                 raise ValueError(f"Unknown metric: {metric}")
             
             # Check if value is valid for this metric
-            valid_values = {
-                'AV': ['N', 'A', 'L', 'P'],
-                'AC': ['L', 'H'],
-                # Add other metrics and their valid values
-            }
-            
-            if metric in valid_values and value not in valid_values[metric]:
+            if value not in cls._VALID_VALUES[metric]:
                 raise ValueError(f"Invalid value {value} for metric {metric}")
             
             calculator.metrics[metric] = value
             found_metrics.add(metric)
 
         # Check all mandatory metrics are present
-        missing_metrics = set(mandatory_metrics) - found_metrics
+        missing_metrics = set(_MANDATORY_ORDER) - found_metrics
         if missing_metrics:
             raise ValueError(f"Missing mandatory metrics: {missing_metrics}")
 
         return calculator
+
+    @classmethod
+    def score_vector(cls, vector_string):
+        """
+        Score a vector string, reusing the result for equivalent vectors.
+        
+        Vectors are canonicalised first so that metric order and explicit
+        Not Defined values do not defeat the cache. Invalid vectors raise the
+        same ValueError as from_vector_string and are not cached.
+        
+        Args:
+            vector_string: CVSS v4.0 vector string
+            
+        Returns:
+            float: CVSS v4.0 base score
+        """
+        return cls._score_for_canonical_vector(_canonical_vector(vector_string))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _score_for_canonical_vector(vector_string):
+        """Parse a canonical vector string and score it, memoised on the string."""
+        return CVSSv4Calculator.from_vector_string(vector_string).calculate_base_score()
         
     def compute_interpolated_score(self, vector, metrics_order=None):
         """
@@ -921,67 +1050,311 @@ class CVSSv4Calculator:
         if metrics_order is None:
             metrics_order = ['AV', 'AC', 'AT', 'PR', 'UI', 'VC', 'VI', 'VA', 'SC', 'SI', 'SA', 'E']
             
-        # Parse vector if string
+        # Parse vector if string, answering repeated strings without parsing them again
         if isinstance(vector, str):
-            calculator = self.from_vector_string(vector)
-            vector_metrics = calculator.metrics
-        else:
-            vector_metrics = vector
-            
-        # Create MacroVector key
-        eq1 = self.get_eq1_level()
-        eq2 = self.get_eq2_level()
-        eq3_eq6 = self.get_eq3_eq6_joint_level()
-        eq4 = self.get_eq4_level()
-        eq5 = self.get_eq5_level()
-        
-        macrovector_key = f"{eq1}{eq2}{eq3_eq6}{eq4}{eq5}"
+            return self._interpolated_score_for_string(vector)
+
+        # Default E to A (Attacked) when not set, as calculate_base_score does
+        if vector.get('E') is None:
+            vector = {**vector, 'E': self.E_ATTACKED}
+
+        # The MacroVector comes from the vector being scored, not from this calculator
+        calculator = CVSSv4Calculator()
+        calculator.metrics.update(vector)
+        return self._interpolated_score(calculator.get_macrovector_levels(), vector)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _interpolated_score_for_string(vector_string):
+        """Parse a vector string and interpolate its score, memoised on the string."""
+        calculator = CVSSv4Calculator.from_vector_string(vector_string)
+        if calculator.metrics['E'] is None:
+            calculator.metrics['E'] = CVSSv4Calculator.E_ATTACKED
+        return CVSSv4Calculator._interpolated_score(calculator.get_macrovector_levels(),
+                                                    calculator.metrics)
+
+    @classmethod
+    def _interpolated_score(cls, levels, vector_metrics):
+        """Interpolate the score of vector_metrics within the MacroVector given by levels."""
+        eq1, eq2, eq3_eq6, eq4, eq5 = levels
         
         # Find base score for this MacroVector
-        if macrovector_key in self.MACROVECTOR_SCORES:
-            base_score = self.MACROVECTOR_SCORES[macrovector_key]
-        else:
+        index = _macrovector_index(eq1, eq2, eq3_eq6, eq4, eq5)
+        base_score = cls._MACROVECTOR_SCORE_LIST[index]
+        if base_score is None:
             # Handle missing key
             return 5.0  # Default midpoint
             
-        # Find highest severity vector
-        highest_severity_vector = self._find_highest_severity_vector(eq1, eq2, eq3_eq6, eq4, eq5)
-        
-        # Calculate severity distance
-        severity_distance = self._calculate_vector_distance(vector_metrics, highest_severity_vector)
-        
-        # Skip interpolation if already at highest severity
-        if severity_distance == 0:
-            return base_score
-        
-        # Find MacroVector depth
-        macrovector_depth = self._get_macrovector_depth(eq1, eq2, eq3_eq6, eq4, eq5)
-        
-        # Calculate proportion
-        proportion = severity_distance / macrovector_depth if macrovector_depth > 0 else 0
-        
-        # Find next lower MacroVector scores
-        lower_scores = self._find_lower_macrovector_scores(eq1, eq2, eq3_eq6, eq4, eq5)
-        
-        # Apply interpolation based on available lower scores
-        if lower_scores:
-            # Calculate mean of proportional distances
-            score_adjustments = []
-            
-            for eq_name, lower_score in lower_scores.items():
-                score_diff = base_score - lower_score
-                score_adjustments.append(proportion * score_diff)
-            
-            if score_adjustments:
-                # Take mean of adjustments
-                mean_adjustment = sum(score_adjustments) / len(score_adjustments)
-                adjusted_score = base_score - mean_adjustment
-            else:
-                # Default adjustment if no specifics
-                adjusted_score = base_score - (proportion * 1.0)
-        else:
-            # Default adjustment if no lower MacroVector
-            adjusted_score = base_score - (proportion * 1.0)
-        
-        # Ensure score within bounds
-        return max(0.0, min(adjusted_score, 10.0))
\ No newline at end of file
+        return _interpolate(_metric_ranks(vector_metrics), index)
+
+
+def _interpolate(vector_ranks, index):
+    """
+    Interpolate a score from severity ranks within the MacroVector at a packed index.
+
+    Works on plain ints from the flat per-MacroVector lists, without building or
+    reading any metric dicts.
+    """
+    cls = CVSSv4Calculator
+    
+    # Calculate severity distance from the MacroVector's highest severity vector.
+    # That vector ranks every metric, so only the vector's own unranked metrics
+    # need masking.
+    highest = cls._HIGHEST_RANK_BYTES[index]
+    if -1 in vector_ranks:
+        severity_distance = sum(abs(rank - top) for rank, top in zip(vector_ranks, highest)
+                                if rank >= 0)
+    else:
+        severity_distance = sum(map(abs, map(sub, vector_ranks, highest)))
+
+    return cls._INTERPOLATED_LIST[index][severity_distance]
+
+
+# Constraint logic for each equivalence class, evaluated once per combination
+# when building the level tables and for values outside the specification
+
+
+def _eq1_level(av, pr, ui):
+    """Evaluate the EQ1 constraints for a single AV, PR, UI combination."""
+    # Check exact match for level 0
+    if (av == CVSSv4Calculator.AV_NETWORK and pr == CVSSv4Calculator.PR_NONE and
+            ui == CVSSv4Calculator.UI_NONE):
+        return 0
+
+    # Level 1: (AV:N or PR:N or UI:N) and not (AV:N and PR:N and UI:N) and not AV:P
+    if ((av == 'N' or pr == 'N' or ui == 'N') and
+            not (av == 'N' and pr == 'N' and ui == 'N') and
+            av != 'P'):
+        return 1
+
+    # Must be level 2
+    return 2
+
+
+def _eq2_level(ac, at):
+    """Evaluate the EQ2 constraints for a single AC, AT combination."""
+    # Check exact match for level 0
+    if ac == CVSSv4Calculator.AC_LOW and at == CVSSv4Calculator.AT_NONE:
+        return 0
+
+    # Must be level 1
+    return 1
+
+
+def _eq5_level(e):
+    """Evaluate the EQ5 level for a single E value."""
+    # Default X to A
+    if e == CVSSv4Calculator.E_NOT_DEFINED:
+        e = CVSSv4Calculator.E_ATTACKED
+
+    if e == CVSSv4Calculator.E_ATTACKED:
+        return 0
+    elif e == CVSSv4Calculator.E_POC:
+        return 1
+    else:  # E_UNREPORTED
+        return 2
+
+
+def _eq3_eq6_joint_level(vc, vi, va, cr, ir, ar):
+    """Evaluate the joint EQ3+EQ6 constraints (Table 30), as an index into _EQ36_LEVELS."""
+    # Check Level 00 
+    if (vc == 'H' and vi == 'H' and 
+        (cr == 'H' or ir == 'H' or (ar == 'H' and va == 'H'))):
+        return 0  # 00
+
+    # Check Level 01
+    if (vc == 'H' and vi == 'H' and 
+        not (cr == 'H' or ir == 'H') and 
+        not (ar == 'H' and va == 'H')):
+        return 1  # 01
+
+    # Check Level 10
+    if (not (vc == 'H' and vi == 'H') and 
+        (vc == 'H' or vi == 'H' or va == 'H') and 
+        ((cr == 'H' and vc == 'H') or 
+        (ir == 'H' and vi == 'H') or 
+        (ar == 'H' and va == 'H'))):
+        return 2  # 10
+
+    # Check Level 11
+    if (not (vc == 'H' and vi == 'H') and 
+        (vc == 'H' or vi == 'H' or va == 'H') and 
+        not (cr == 'H' and vc == 'H') and 
+        not (ir == 'H' and vi == 'H') and 
+        not (ar == 'H' and va == 'H')):
+        return 3  # 11
+
+    # Default to Level 21
+    return 4  # 21
+
+
+def _eq3_level(vc, vi, va):
+    """Evaluate the EQ3 constraints (Table 26) for a single combination."""
+    # Level 0: VC:H and VI:H
+    if vc == 'H' and vi == 'H':
+        return 0
+
+    # Level 1: not (VC:H and VI:H) and (VC:H or VI:H or VA:H)
+    if (not (vc == 'H' and vi == 'H') and 
+        (vc == 'H' or vi == 'H' or va == 'H')):
+        return 1
+
+    # Level 2: not (VC:H or VI:H or VA:H)
+    return 2
+
+
+def _eq4_level(sc, si, sa, msi, msa):
+    """Evaluate the EQ4 constraints for a single combination."""
+    # Level 0: MSI:S or MSA:S
+    if msi == 'S' or msa == 'S' or si == 'S' or sa == 'S':  # Check SI and SA too!
+        return 0
+
+    # Level 1: not (MSI:S or MSA:S) and (SC:H or SI:H or SA:H)
+    if (not (msi == 'S' or msa == 'S' or si == 'S' or sa == 'S') and 
+        (sc == 'H' or si == 'H' or sa == 'H')):
+        return 1
+
+    # Level 2: not (MSI:S or MSA:S) and not (SC:H or SI:H or SA:H)
+    return 2
+
+
+def _eq6_level(vc, vi, va, cr, ir, ar):
+    """Evaluate the EQ6 constraints (Table 29) for a single combination."""
+    # Level 0: (CR:H and VC:H) or (IR:H and VI:H) or (AR:H and VA:H)
+    if ((cr == 'H' and vc == 'H') or 
+        (ir == 'H' and vi == 'H') or 
+        (ar == 'H' and va == 'H')):
+        return 0
+
+    # Level 1
+    return 1
+
+
+# Domains of the metrics feeding each equivalence class. None covers metrics
+# that have not been set, so every reachable combination is precomputed.
+_EXPLOITABILITY_VALUES = {
+    'AV': ('N', 'A', 'L', 'P', None),
+    'AC': ('L', 'H', None),
+    'AT': ('N', 'P', None),
+    'PR': ('N', 'L', 'H', None),
+    'UI': ('N', 'P', 'A', None),
+    'E': ('X', 'A', 'P', 'U', None),
+}
+_IMPACT_VALUES = ('H', 'L', 'N', None)
+_SUBSEQUENT_VALUES = ('H', 'L', 'N', 'S', None)
+_REQUIREMENT_VALUES = ('H', 'M', 'L', 'X')
+
+
+def _requirements_as_h(key):
+    """Replace Not Defined CR, IR, AR in a (VC, VI, VA, CR, IR, AR) key with H."""
+    vc, vi, va, cr, ir, ar = key
+    return (vc, vi, va,
+            'H' if cr == 'X' else cr, 'H' if ir == 'X' else ir, 'H' if ar == 'X' else ar)
+
+
+def _build_eq_tables(cls):
+    """
+    Precompute EQ level lookup tables by running the constraint logic once.
+
+    Each table maps the tuple of input metric values to its level, so the
+    getters reduce to a single dict lookup.
+    """
+    values = _EXPLOITABILITY_VALUES
+    cls._EQ1_TABLE = {
+        (av, pr, ui): _eq1_level(av, pr, ui)
+        for av in values['AV'] for pr in values['PR'] for ui in values['UI']
+    }
+    cls._EQ2_TABLE = {
+        (ac, at): _eq2_level(ac, at)
+        for ac in values['AC'] for at in values['AT']
+    }
+    cls._EQ5_TABLE = {e: _eq5_level(e) for e in values['E']}
+    cls._EQ3_TABLE = {
+        (vc, vi, va): _eq3_level(vc, vi, va)
+        for vc in _IMPACT_VALUES for vi in _IMPACT_VALUES for va in _IMPACT_VALUES
+    }
+    cls._EQ4_TABLE = {
+        (sc, si, sa, msi, msa): _eq4_level(sc, si, sa, msi, msa)
+        for sc in _IMPACT_VALUES for si in _SUBSEQUENT_VALUES for sa in _SUBSEQUENT_VALUES
+        for msi in _SUBSEQUENT_VALUES for msa in _SUBSEQUENT_VALUES
+    }
+    impact_requirements = [
+        (vc, vi, va, cr, ir, ar)
+        for vc in _IMPACT_VALUES for vi in _IMPACT_VALUES for va in _IMPACT_VALUES
+        for cr in _REQUIREMENT_VALUES for ir in _REQUIREMENT_VALUES for ar in _REQUIREMENT_VALUES
+    ]
+    # Vectors parsed from strings may still carry CR/IR/AR:X, which scores as H
+    cls._EQ6_TABLE = {key: _eq6_level(*_requirements_as_h(key)) for key in impact_requirements}
+    cls._EQ3_EQ6_TABLE = {key: _eq3_eq6_joint_level(*_requirements_as_h(key))
+                          for key in impact_requirements}
+
+
+_build_eq_tables(CVSSv4Calculator)
+
+
+def _build_macrovector_tables(cls):
+    """
+    Precompute the highest and lowest severity vectors, the depth and the lower
+    neighbour scores of every MacroVector in flat lists indexed by its packed
+    levels, along with a (position, character) -> keys index over the
+    MacroVector keys.
+    """
+    # Flat score list indexed by the packed MacroVector levels, None where undefined
+    cls._MACROVECTOR_SCORE_LIST = [None] * 270
+    for key, score in cls.MACROVECTOR_SCORES.items():
+        if key[2:4] not in _EQ3_EQ6_INDEX:
+            # Not a reachable joint EQ3+EQ6 level, never looked up by level
+            continue
+        index = _macrovector_index(int(key[0]), int(key[1]), _EQ3_EQ6_INDEX[key[2:4]],
+                                   int(key[4]), int(key[5]))
+        cls._MACROVECTOR_SCORE_LIST[index] = score
+
+    cls._MACROVECTOR_ORDER = {key: index for index, key in enumerate(cls.MACROVECTOR_SCORES)}
+    cls._POSITION_INDEX = [{} for _ in range(6)]
+    for key in cls.MACROVECTOR_SCORES:
+        for position, char in enumerate(key):
+            cls._POSITION_INDEX[position].setdefault(char, []).append(key)
+
+    cls._HIGHEST_VECTOR_LIST = [None] * 270
+    cls._LOWEST_VECTOR_LIST = [None] * 270
+    cls._DEPTH_LIST = [None] * 270
+    cls._LOWER_SCORES_LIST = [None] * 270
+    for eq1 in (0, 1, 2):
+        for eq2 in (0, 1):
+            for eq3_eq6 in range(len(_EQ36_LEVELS)):
+                for eq4 in (0, 1, 2):
+                    for eq5 in (0, 1, 2):
+                        levels = (eq1, eq2, eq3_eq6, eq4, eq5)
+                        index = _macrovector_index(*levels)
+                        highest_vector = cls._highest_severity_vector(*levels)
+                        lowest_vector = cls._lowest_severity_vector(*levels)
+                        cls._HIGHEST_VECTOR_LIST[index] = highest_vector
+                        cls._LOWEST_VECTOR_LIST[index] = lowest_vector
+                        cls._DEPTH_LIST[index] = cls._calculate_vector_distance(
+                            highest_vector, lowest_vector)
+                        cls._LOWER_SCORES_LIST[index] = cls._lower_macrovector_scores(*levels)
+
+    # The same tables as arrays indexed by packed levels for the batch APIs,
+    # with NaN marking undefined MacroVectors
+    cls._MACROVECTOR_SCORE_ARRAY = np.array(
+        [np.nan if score is None else score for score in cls._MACROVECTOR_SCORE_LIST])
+    # Highest severity vectors rank every metric, so their ranks fit in bytes
+    cls._HIGHEST_RANK_BYTES = [bytes(_metric_ranks(vector)) for vector in cls._HIGHEST_VECTOR_LIST]
+    cls._HIGHEST_RANK_ARRAY = np.array([list(ranks) for ranks in cls._HIGHEST_RANK_BYTES],
+                                       dtype=np.int8)
+
+    # Interpolated score of every MacroVector at every possible severity distance.
+    # Distances are small integers bounded by the rank ranges, so the whole
+    # interpolation is a table lookup; undefined MacroVectors use the 5.0 default.
+    max_distance = sum(max(ranks.values()) for ranks in _SEVERITY_ORDERING.values())
+    cls._INTERPOLATED_LIST = [
+        [_interp_core(5.0 if base_score is None else base_score, distance, depth,
+                      tuple(lower_scores.values()))
+         for distance in range(max_distance + 1)]
+        for base_score, depth, lower_scores in zip(
+            cls._MACROVECTOR_SCORE_LIST, cls._DEPTH_LIST, cls._LOWER_SCORES_LIST)
+    ]
+    cls._INTERPOLATED_ARRAY = np.array(cls._INTERPOLATED_LIST)
+
+
+_build_macrovector_tables(CVSSv4Calculator)
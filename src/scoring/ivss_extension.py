@@ -1,3 +1,40 @@
+import functools
+import logging
+import re
+import types
+import weakref
+from operator import itemgetter
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Metrics in vector string order
+_METRIC_ORDER = ('RC', 'BC', 'RL', 'EC', 'EX', 'AU', 'UI', 'AV',
+                 'LA', 'CP', 'VI', 'MI', 'CI', 'PI', 'RI', 'SI', 'CD')
+
+# Metrics the final score needs besides RC, BC, RL, which an external CVSS
+# score replaces, in vector string order, with getters for their values
+_REQUIRED_BS = ('RC', 'BC', 'RL')
+_REQUIRED_FINAL = ('EC', 'EX', 'AU', 'UI', 'LA', 'CP', 'VI', 'MI', 'CI', 'PI', 'RI', 'SI', 'CD')
+_base_severity_values = itemgetter(*_REQUIRED_BS)
+_final_values = itemgetter(*_REQUIRED_FINAL)
+
+# Metric values in _METRIC_ORDER, from a metrics dict
+_metric_values = itemgetter(*_METRIC_ORDER)
+
+
+# Read-only calculators handed out by from_vector_string(shared=True)
+_SHARED_CALCULATORS = weakref.WeakValueDictionary()
+
+# Prefix of every IVSS vector string
+_VECTOR_PREFIX = 'IVSS:1.0/'
+
+# A well-formed run of METRIC:VALUE parts, and a single part within it
+_VECTOR_BODY_RE = re.compile(r"[A-Z]+:[A-Z]+(?:/[A-Z]+:[A-Z]+)*")
+_PART_RE = re.compile(r"([A-Z]+):([A-Z]+)")
+
+
 class IVSSCalculator:
     # Constants remain the same as your original code
     # Base metrics
@@ -86,6 +123,11 @@ class IVSSCalculator:
     FINANCIAL_LOSS_IMPACT_HIGH = 1.0
     FINANCIAL_LOSS_IMPACT_NOT_DEFINED = 1.0
     
+    # Instances only carry the metric and score dicts and the external CVSS
+    # state; the constants live on the class
+    __slots__ = ('metrics', 'scores', 'use_external_cvss', 'external_cvss_score', '_scored_state',
+                 '_vector_cache', '_frozen', '__weakref__')
+    
     def __init__(self):
         """Initialise IVSS calculator with empty metrics."""
         self.metrics = {
@@ -129,38 +171,36 @@ class IVSSCalculator:
         
         self.use_external_cvss = False
         self.external_cvss_score = None
+        
+        # (metric values, external CVSS state) the scores in self.scores were
+        # computed from; they are only reused while these are unchanged
+        self._scored_state = None
+        
+        # (metric values, vector string) from the last to_vector_string call
+        self._vector_cache = None
+        
+        # Set on calculators shared by from_vector_string, which must not change
+        self._frozen = False
 
     def set_base_metrics(self, rc, bc, rl, ec, ex, au, ui, av):
         """Set all base metrics at once."""
-        self.metrics['RC'] = rc
-        self.metrics['BC'] = bc
-        self.metrics['RL'] = rl
-        self.metrics['EC'] = ec
-        self.metrics['EX'] = ex
-        self.metrics['AU'] = au
-        self.metrics['UI'] = ui
-        self.metrics['AV'] = av
+        self._update_metrics({'RC': rc, 'BC': bc, 'RL': rl, 'EC': ec,
+                              'EX': ex, 'AU': au, 'UI': ui, 'AV': av})
         return self
 
     def set_local_environment_metrics(self, la, cp):
         """Set local environment metrics."""
-        self.metrics['LA'] = la
-        self.metrics['CP'] = cp
+        self._update_metrics({'LA': la, 'CP': cp})
         return self
 
     def set_process_consequence_metrics(self, vi, mi, ci):
         """Set process consequence metrics."""
-        self.metrics['VI'] = vi
-        self.metrics['MI'] = mi
-        self.metrics['CI'] = ci
+        self._update_metrics({'VI': vi, 'MI': mi, 'CI': ci})
         return self
 
     def set_impact_metrics(self, pi, ri, si, cd):
         """Set impact metrics."""
-        self.metrics['PI'] = pi
-        self.metrics['RI'] = ri
-        self.metrics['SI'] = si
-        self.metrics['CD'] = cd
+        self._update_metrics({'PI': pi, 'RI': ri, 'SI': si, 'CD': cd})
         return self
         
     def set_cvss_base_score(self, cvss_score):
@@ -168,10 +208,35 @@ class IVSSCalculator:
         Set base score from external CVSS score.
         Allows using existing CVSS scores with IVSS environmental modifiers.
         """
+        if self._frozen:
+            raise ValueError("Cannot change the metrics of a shared calculator")
         self.use_external_cvss = True
         self.external_cvss_score = cvss_score
         return self
 
+    def _update_metrics(self, values):
+        """Store metric values, unless this is a shared calculator."""
+        if self._frozen:
+            raise ValueError("Cannot change the metrics of a shared calculator")
+        self.metrics.update(values)
+
+    def _score_state(self):
+        """Return the metric values and external CVSS state the scores depend on."""
+        return (_metric_values(self.metrics), self.use_external_cvss, self.external_cvss_score)
+
+    def _cached_score(self, key):
+        """Return a score computed from the current metric values, or None."""
+        # The metrics dict can be changed directly, so scores are checked
+        # against the values they were computed from, as to_vector_string does
+        return self.scores[key] if self._scored_state == self._score_state() else None
+
+    def _store_score(self, key, score):
+        """Store a score computed by one of the individual score methods."""
+        # It may be for other metric values than the rest of self.scores, so
+        # none of them are reused until calculate_final_score runs again
+        self._scored_state = None
+        self.scores[key] = score
+
     def calculate_base_severity_score(self):
         """Calculate Base Severity (BS) score."""
         # If using external CVSS score, return it
@@ -179,31 +244,39 @@ class IVSSCalculator:
             self.scores['BS'] = self.external_cvss_score
             return self.external_cvss_score
             
+        score = self._cached_score('BS')
+        if score is not None:
+            return score
+        
         rc = self.metrics['RC']
         bc = self.metrics['BC']
         rl = self.metrics['RL']
         
-        if any(m is None for m in [rc, bc, rl]):
+        if None in (rc, bc, rl):
             raise ValueError("All base severity metrics must be set")
         
-        # Formula: ((RC+BC*3+RL)/4)*10
-        score = ((rc + bc * 3 + rl) / 4) * 10
-        self.scores['BS'] = score
+        # Formula: ((RC+BC*3+RL)/4)*10, as one exact multiply
+        score = (rc + bc * 3 + rl) * 2.5
+        self._store_score('BS', score)
         return score
 
     def calculate_base_exploitability_score(self):
         """Calculate Base Exploitability (BEX) score."""
+        score = self._cached_score('BEX')
+        if score is not None:
+            return score
+        
         ec = self.metrics['EC']
         ex = self.metrics['EX']
         au = self.metrics['AU']
         ui = self.metrics['UI']
         
-        if any(m is None for m in [ec, ex, au, ui]):
+        if None in (ec, ex, au, ui):
             raise ValueError("All exploitability metrics must be set")
         
-        # Formula: ((EC+EX+AU+UI)/4)*10
-        score = ((ec + ex + au + ui) / 4) * 10
-        self.scores['BEX'] = score
+        # Formula: ((EC+EX+AU+UI)/4)*10, as one exact multiply
+        score = (ec + ex + au + ui) * 2.5
+        self._store_score('BEX', score)
         return score
         
     def calculate_base_accessibility_score(self):
@@ -232,53 +305,69 @@ class IVSSCalculator:
             
         # FIXED: Formula: ((BS+BEX+(AV*10*2))/4)
         # Changed to: ((BS+BEX+(AV*2))/4)
-        score = (bs + bex + (av * 2)) / 4
+        score = (bs + bex + (av * 2)) * 0.25
         return score
 
     def calculate_local_accessibility(self):
         """Calculate Local Accessibility (ACC) score."""
+        score = self._cached_score('ACC')
+        if score is not None:
+            return score
+        
         la = self.metrics['LA']
         cp = self.metrics['CP']
         
-        if any(m is None for m in [la, cp]):
+        if None in (la, cp):
             raise ValueError("All local accessibility metrics must be set")
         
         # Formula: (LA*CP)*10
         score = (la * cp) * 10
-        self.scores['ACC'] = score
+        self._store_score('ACC', score)
         return score
 
     def calculate_consequences(self):
         """Calculate Consequences (CON) score."""
+        score = self._cached_score('CON')
+        if score is not None:
+            return score
+        
         vi = self.metrics['VI']
         mi = self.metrics['MI']
         ci = self.metrics['CI']
         
-        if any(m is None for m in [vi, mi, ci]):
+        if None in (vi, mi, ci):
             raise ValueError("All process consequence metrics must be set")
         
         # Formula: ((VI+MI+CI*3)/5)*10
         score = ((vi + mi + ci * 3) / 5) * 10
-        self.scores['CON'] = score
+        self._store_score('CON', score)
         return score
 
     def calculate_impact(self):
         """Calculate Impact (IMP) score."""
+        score = self._cached_score('IMP')
+        if score is not None:
+            return score
+        
         pi = self.metrics['PI']
         ri = self.metrics['RI']
         si = self.metrics['SI']
         cd = self.metrics['CD']
         
-        if any(m is None for m in [pi, ri, si, cd]):
+        if None in (pi, ri, si, cd):
             raise ValueError("All impact metrics must be set")
         
         # Formula: (CD*5*PI*2+RI+SI*6)/14*10
         score = (cd * 5 * pi * 2 + ri + si * 6) / 14 * 10
-        self.scores['IMP'] = score
+        self._store_score('IMP', score)
         return score
 
     def calculate_adjusted_accessibility(self):
         """Calculate Adjusted Accessibility (ADJACC) score."""
+        score = self._cached_score('ADJACC')
+        if score is not None:
+            return score
+        
         la = self.metrics['LA']
         
         if la is None:
@@ -286,97 +375,132 @@ class IVSSCalculator:
         
         # FIXED: Formula: LA
         # Changed to: LA*10 to match formula
-        self.scores['ADJACC'] = la * 10
+        self._store_score('ADJACC', la * 10)
         return la * 10
 
     def calculate_adjusted_criticality(self):
         """Calculate Adjusted Criticality (ADJIMP) score."""
+        score = self._cached_score('ADJIMP')
+        if score is not None:
+            return score
+        
         con = self.calculate_consequences()
         imp = self.calculate_impact()
         
         # Formula: (CON+(IMP*2))/3
         score = (con + (imp * 2)) / 3
-        self.scores['ADJIMP'] = score
+        self._store_score('ADJIMP', score)
         return score
 
     def calculate_final_score(self):
         """Calculate final IVSS score based on all metrics."""
-        if self.use_external_cvss:
-            bs = self.external_cvss_score
-        else:
-            bs = self.calculate_base_severity_score()
-            
-        adj_imp = self.calculate_adjusted_criticality()
-        adj_acc = self.calculate_adjusted_accessibility()
-        
-        # Debug intermediate values
-        #print(f"\n---- IVSS Score Calculation Breakdown ----")
-        #print(f"Base Severity (BS): {bs:.2f}")
-        
-        # Calculate Base Exploitability for debugging
-        bex = self.calculate_base_exploitability_score()
-        #print(f"Base Exploitability (BEX): {bex:.2f}")
-        
-        # Calculate Base Accessibility for debugging
-        av = self.metrics['AV']
+        state = self._score_state()
+        if state != self._scored_state:
+            # Scores depend only on the metric values and the external CVSS score,
+            # so calculators with the same values share one computation
+            values, use_external, external_score = state
+            self.scores.update(_final_scores(values, use_external,
+                                             external_score if use_external else None))
+            self._scored_state = state
+        
+        # Debug intermediate values, only formatted when debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_score_breakdown()
+        return self.scores['FINAL']
+
+    def _log_score_breakdown(self):
+        """Log the sub-scores behind the last final score."""
+        m = self.metrics
+        s = self.scores
+        bs = self.external_cvss_score if self.use_external_cvss else s['BS']
+        bex, adj_imp, adj_acc = s['BEX'], s['ADJIMP'], s['ADJACC']
+        av = m['AV']
         base_acc = av * 10 if av is not None else 0
-        #print(f"Base Accessibility (AV*10): {base_acc:.2f}")
-        
-        # Calculate Total Base Score for debugging
-        total_base = (bs + bex + (av * 2)) / 4 if av is not None else 0
-        #print(f"Total Base Score: {total_base:.2f}")
-        
-        # Local environment parameters
-        la = self.metrics['LA']
-        cp = self.metrics['CP']
-        #print(f"Asset Access (LA): {la:.2f}")
-        #print(f"Network Segmentation (CP): {cp:.2f}")
-        
-        # Local Accessibility
-        local_acc = self.calculate_local_accessibility()
-        #print(f"Local Accessibility (ACC = LA*CP*10): {local_acc:.2f}")
-        
-        # Process consequences
-        vi = self.metrics['VI']
-        mi = self.metrics['MI']
-        ci = self.metrics['CI']
-        #print(f"Process Visibility (VI): {vi:.2f}")
-        #print(f"Process Monitoring (MI): {mi:.2f}")
-        #print(f"Process Control (CI): {ci:.2f}")
-        
-        # Consequences calculation
-        con = self.calculate_consequences()
-        #print(f"Consequences (CON = (VI+MI+CI*3)/5*10): {con:.2f}")
-        
-        # Impact parameters
-        pi = self.metrics['PI']
-        ri = self.metrics['RI']
-        si = self.metrics['SI']
-        cd = self.metrics['CD']
-        #print(f"Production Impact (PI): {pi:.2f}")
-        #print(f"Reliability Impact (RI): {ri:.2f}")
-        #print(f"Safety Impact (SI): {si:.2f}")
-        #print(f"Financial Loss Impact (CD): {cd:.2f}")
-        
-        # Impact calculation
-        imp = self.calculate_impact()
-        #print(f"Impact (IMP = (CD*5*PI*2+RI+SI*6)/14*10): {imp:.2f}")
-        
-        # Adjusted values
-        #print(f"Adjusted Accessibility (ADJACC = LA*10): {adj_acc:.2f}")
-        #print(f"Adjusted Criticality (ADJIMP = (CON+(IMP*2))/3): {adj_imp:.2f}")
-        
-        # Final score calculation
-        formula_components = f"({bs:.2f} + {adj_imp:.2f}*5 + {adj_acc:.2f}*10) / 16"
+        total_base = (bs + bex + (av * 2)) * 0.25 if av is not None else 0
         numerator = bs + adj_imp * 5 + adj_acc * 10
-        #print(f"Final Score Formula: {formula_components}")
-        #print(f"Numerator: {numerator:.2f}")
-        #print(f"Final Score: {numerator:.2f} / 16 = {numerator/16:.2f}")
+        logger.debug("---- IVSS Score Calculation Breakdown ----")
+        logger.debug("Base Severity (BS): %.2f", bs)
+        logger.debug("Base Exploitability (BEX): %.2f", bex)
+        logger.debug("Base Accessibility (AV*10): %.2f", base_acc)
+        logger.debug("Total Base Score: %.2f", total_base)
+        logger.debug("Asset Access (LA): %.2f", m['LA'])
+        logger.debug("Network Segmentation (CP): %.2f", m['CP'])
+        logger.debug("Local Accessibility (ACC = LA*CP*10): %.2f", s['ACC'])
+        logger.debug("Process Visibility (VI): %.2f", m['VI'])
+        logger.debug("Process Monitoring (MI): %.2f", m['MI'])
+        logger.debug("Process Control (CI): %.2f", m['CI'])
+        logger.debug("Consequences (CON = (VI+MI+CI*3)/5*10): %.2f", s['CON'])
+        logger.debug("Production Impact (PI): %.2f", m['PI'])
+        logger.debug("Reliability Impact (RI): %.2f", m['RI'])
+        logger.debug("Safety Impact (SI): %.2f", m['SI'])
+        logger.debug("Financial Loss Impact (CD): %.2f", m['CD'])
+        logger.debug("Impact (IMP = (CD*5*PI*2+RI+SI*6)/14*10): %.2f", s['IMP'])
+        logger.debug("Adjusted Accessibility (ADJACC = LA*10): %.2f", adj_acc)
+        logger.debug("Adjusted Criticality (ADJIMP = (CON+(IMP*2))/3): %.2f", adj_imp)
+        logger.debug("Final Score Formula: (%.2f + %.2f*5 + %.2f*10) / 16", bs, adj_imp, adj_acc)
+        logger.debug("Numerator: %.2f", numerator)
+        logger.debug("Final Score: %.2f / 16 = %.2f", numerator, numerator / 16)
+
+    def calculate_all_scores(self):
+        """
+        Calculate every IVSS score.
         
-        # Original formula
-        score = (bs + adj_imp * 5 + adj_acc * 10) / 16
-        self.scores['FINAL'] = score
-        return score
+        Returns:
+            dict: Scores keyed as in self.scores, or {'error': message} naming
+            the required metrics that have not been set
+        """
+        m = self.metrics
+        if None in _final_values(m) or (not self.use_external_cvss and None in _base_severity_values(m)):
+            required = _REQUIRED_FINAL if self.use_external_cvss else _REQUIRED_BS + _REQUIRED_FINAL
+            missing = [metric for metric in required if m[metric] is None]
+            return {'error': f"Missing metrics: {', '.join(missing)}"}
+        
+        self.calculate_final_score()
+        return dict(self.scores)
+
+    @classmethod
+    def calculate_batch(cls, metrics, cvss_scores=None, dtype=np.float64):
+        """
+        Calculate IVSS scores for many vulnerabilities at once.
+        
+        Vectorised equivalent of calculate_all_scores: each formula is evaluated
+        over whole columns in the same order of operations, so the scores are
+        identical to scoring one calculator per vulnerability.
+        
+        Args:
+            metrics: Mapping of metric name ('RC', 'BC', ...) to a sequence of
+                metric values, one per vulnerability
+            cvss_scores: Optional sequence of external CVSS scores to use as the
+                Base Severity, as set_cvss_base_score does
+            dtype: Floating point type of the score arrays. np.float32 halves
+                memory use for large batches, at the cost of matching the
+                single-calculator scores only to about 1e-5
+            
+        Returns:
+            dict: (N,) score arrays keyed as in self.scores
+        """
+        required = ('EC', 'EX', 'AU', 'UI', 'LA', 'CP', 'VI', 'MI', 'CI', 'PI', 'RI', 'SI', 'CD')
+        if cvss_scores is None:
+            required = ('RC', 'BC', 'RL') + required
+        missing = [metric for metric in required if metric not in metrics]
+        if missing:
+            raise ValueError(f"Missing metrics: {', '.join(missing)}")
+        m = {metric: np.asarray(metrics[metric], dtype=dtype) for metric in required}
+        
+        if cvss_scores is None:
+            bs = (m['RC'] + m['BC'] * 3 + m['RL']) * 2.5
+        else:
+            bs = np.asarray(cvss_scores, dtype=dtype)
+        bex = (m['EC'] + m['EX'] + m['AU'] + m['UI']) * 2.5
+        acc = (m['LA'] * m['CP']) * 10
+        con = ((m['VI'] + m['MI'] + m['CI'] * 3) / 5) * 10
+        imp = (m['CD'] * 5 * m['PI'] * 2 + m['RI'] + m['SI'] * 6) / 14 * 10
+        adj_acc = m['LA'] * 10
+        adj_imp = (con + (imp * 2)) / 3
+        final = (bs + adj_imp * 5 + adj_acc * 10) * 0.0625
+        
+        return {'BS': bs, 'BEX': bex, 'ACC': acc, 'CON': con, 'IMP': imp,
+                'ADJACC': adj_acc, 'ADJIMP': adj_imp, 'FINAL': final}
 
     # Test the calculator with maximum values
     def test_max_score():
@@ -416,7 +540,7 @@ class IVSSCalculator:
         scores = calculator.calculate_all_scores()
 
     @classmethod
-    def from_vector_string(cls, vector_string):
+    def from_vector_string(cls, vector_string, shared=False):
         """
         Create IVSS calculator from vector string.
         
@@ -427,179 +551,54 @@ class IVSSCalculator:
         Local Environment: LA, CP
         Process Consequences: VI, MI, CI
         Impact Metrics: PI, RI, SI, CD
+        
+        With shared=True, callers parsing the same string get the same
+        read-only calculator while any of them holds it: its setters raise
+        ValueError and its metrics are a read-only mapping. The score methods
+        still fill in its scores dict. Useful for scoring inventories with
+        many repeated vectors.
         """
+        if shared:
+            key = (cls, vector_string)
+            calculator = _SHARED_CALCULATORS.get(key)
+            if calculator is None:
+                calculator = cls.from_vector_string(vector_string)
+                calculator._frozen = True
+                calculator.metrics = types.MappingProxyType(calculator.metrics)
+                _SHARED_CALCULATORS[key] = calculator
+            return calculator
+        
         calculator = cls()
         
         # Split vector string into components
         try:
             # Validate initial format
-            if not vector_string.startswith('IVSS:1.0/'):
+            if not vector_string.startswith(_VECTOR_PREFIX):
                 raise ValueError("Invalid vector string format")
             
-            # Remove 'IVSS:1.0/' prefix and split into metric components
-            components = vector_string.replace('IVSS:1.0/', '').split('/')
-            
-            # Create comprehensive reverse mapping dictionaries
-            reverse_mappings = {
-                # Base metrics
-                'RC': {
-                    'U': cls.REPORT_CONFIDENCE_UNCONFIRMED,
-                    'UC': cls.REPORT_CONFIDENCE_UNCORROBORATED,
-                    'C': cls.REPORT_CONFIDENCE_CONFIRMED,
-                    'ND': cls.REPORT_CONFIDENCE_NOT_DEFINED
-                },
-                'BC': {
-                    'TD': cls.CONSEQUENCE_TEMPORARY_DENIAL,
-                    'DM': cls.CONSEQUENCE_DATA_MODIFICATION,
-                    'SD': cls.CONSEQUENCE_SUSTAINED_DENIAL,
-                    'C': cls.CONSEQUENCE_CONTROL
-                },
-                'RL': {
-                    'OF': cls.REMEDIATION_LEVEL_OFFICIAL_FIX,
-                    'W': cls.REMEDIATION_LEVEL_WORKAROUND,
-                    'TF': cls.REMEDIATION_LEVEL_TEMPORARY_FIX,
-                    'U': cls.REMEDIATION_LEVEL_UNAVAILABLE,
-                    'ND': cls.REMEDIATION_LEVEL_NOT_DEFINED
-                },
-                'EC': {
-                    'H': cls.EXPLOIT_DIFFICULTY_HIGH,
-                    'M': cls.EXPLOIT_DIFFICULTY_MODERATE,
-                    'L': cls.EXPLOIT_DIFFICULTY_LOW
-                },
-                'EX': {
-                    'U': cls.EXPLOIT_MATURITY_UNPROVEN,
-                    'POC': cls.EXPLOIT_MATURITY_POC,
-                    'F': cls.EXPLOIT_MATURITY_FUNCTIONAL,
-                    'ND': cls.EXPLOIT_MATURITY_NOT_DEFINED
-                },
-                'AU': {
-                    'AR': cls.PRIVILEGE_LEVEL_ADMIN_ROOT,
-                    'U': cls.PRIVILEGE_LEVEL_USER,
-                    'N': cls.PRIVILEGE_LEVEL_NONE
-                },
-                'UI': {
-                    'Y': cls.USER_INTERACTION_YES,
-                    'N': cls.USER_INTERACTION_NO
-                },
-                'AV': {
-                    'LH': cls.THREAT_VECTOR_LOCAL_HOST,
-                    'LN': cls.THREAT_VECTOR_LOCAL_NETWORK,
-                    'AR': cls.THREAT_VECTOR_ADJACENT_REMOTE,
-                    'U': cls.THREAT_VECTOR_UNDEFINED
-                },
-                
-                # Local environment metrics
-                'LA': {
-                    'LH': cls.ASSET_ACCESS_LOCAL_HOST,
-                    'LN': cls.ASSET_ACCESS_LOCAL_NETWORK,
-                    'AR': cls.ASSET_ACCESS_ADJACENT_REMOTE
-                },
-                'CP': {
-                    'C': cls.NETWORK_SEGMENTATION_COMPLIANT,
-                    'P': cls.NETWORK_SEGMENTATION_PARTIAL,
-                    'D': cls.NETWORK_SEGMENTATION_DMZ_ONLY,
-                    'N': cls.NETWORK_SEGMENTATION_NONE
-                },
-                
-                # Process consequence metrics
-                'VI': {
-                    'N': cls.PROCESS_VISIBILITY_NONE,
-                    'P': cls.PROCESS_VISIBILITY_PARTIAL,
-                    'C': cls.PROCESS_VISIBILITY_COMPLETE
-                },
-                'MI': {
-                    'N': cls.PROCESS_MONITORING_NONE,
-                    'P': cls.PROCESS_MONITORING_PARTIAL,
-                    'C': cls.PROCESS_MONITORING_COMPLETE
-                },
-                'CI': {
-                    'N': cls.PROCESS_CONTROL_NONE,
-                    'P': cls.PROCESS_CONTROL_PARTIAL,
-                    'C': cls.PROCESS_CONTROL_COMPLETE
-                },
-                
-                # Impact metrics
-                'PI': {
-                    'N': cls.SYSTEM_PRODUCTION_IMPACT_NONE,
-                    'L': cls.SYSTEM_PRODUCTION_IMPACT_LOW,
-                    'M': cls.SYSTEM_PRODUCTION_IMPACT_MEDIUM,
-                    'H': cls.SYSTEM_PRODUCTION_IMPACT_HIGH,
-                    'ND': cls.SYSTEM_PRODUCTION_IMPACT_NOT_DEFINED
-                },
-                'RI': {
-                    'N': cls.SYSTEM_RELIABILITY_IMPACT_NONE,
-                    'L': cls.SYSTEM_RELIABILITY_IMPACT_LOW,
-                    'M': cls.SYSTEM_RELIABILITY_IMPACT_MEDIUM,
-                    'H': cls.SYSTEM_RELIABILITY_IMPACT_HIGH,
-                    'ND': cls.SYSTEM_RELIABILITY_IMPACT_NOT_DEFINED
-                },
-                'SI': {
-                    'N': cls.SYSTEM_SAFETY_IMPACT_NONE,
-                    'L': cls.SYSTEM_SAFETY_IMPACT_LOW,
-                    'M': cls.SYSTEM_SAFETY_IMPACT_MEDIUM,
-                    'H': cls.SYSTEM_SAFETY_IMPACT_HIGH,
-                    'ND': cls.SYSTEM_SAFETY_IMPACT_NOT_DEFINED
-                },
-                'CD': {
-                    'N': cls.FINANCIAL_LOSS_IMPACT_NONE,
-                    'L': cls.FINANCIAL_LOSS_IMPACT_LOW,
-                    'LM': cls.FINANCIAL_LOSS_IMPACT_LOW_MEDIUM,
-                    'MH': cls.FINANCIAL_LOSS_IMPACT_MEDIUM_HIGH,
-                    'H': cls.FINANCIAL_LOSS_IMPACT_HIGH,
-                    'ND': cls.FINANCIAL_LOSS_IMPACT_NOT_DEFINED
-                }
-            }
+            # Slice off the validated 'IVSS:1.0/' prefix and split into metric
+            # components, with a single regex pass when the body is well formed
+            body = vector_string[len(_VECTOR_PREFIX):]
+            if _VECTOR_BODY_RE.fullmatch(body):
+                components = _PART_RE.findall(body)
+            else:
+                components = [component.split(':') for component in body.split('/')]
             
             # Parse metrics
             metrics = {}
             
             # Parse each component
-            for component in components:
-                metric, value = component.split(':')
-                
-                # Check if metric exists in mappings
-                if metric in reverse_mappings:
-                    # Check if value exists in mapping for this metric
-                    if value in reverse_mappings[metric]:
-                        metrics[metric] = reverse_mappings[metric][value]
-                    else:
-                        raise ValueError(f"Invalid value {value} for metric {metric}")
+            for metric, value in components:
+                metric_value = _CODE_VALUES.get((metric, value))
+                if metric_value is not None:
+                    metrics[metric] = metric_value
+                elif metric in _REVERSE_METRIC_MAP:
+                    raise ValueError(f"Invalid value {value} for metric {metric}")
                 else:
                     raise ValueError(f"Unknown metric {metric}")
             
-            # Set metrics
-            # Base metrics
-            calculator.set_base_metrics(
-                rc=metrics.get('RC', cls.REPORT_CONFIDENCE_NOT_DEFINED),
-                bc=metrics.get('BC', cls.CONSEQUENCE_CONTROL),
-                rl=metrics.get('RL', cls.REMEDIATION_LEVEL_NOT_DEFINED),
-                ec=metrics.get('EC', cls.EXPLOIT_DIFFICULTY_LOW),
-                ex=metrics.get('EX', cls.EXPLOIT_MATURITY_NOT_DEFINED),
-                au=metrics.get('AU', cls.PRIVILEGE_LEVEL_NONE),
-                ui=metrics.get('UI', cls.USER_INTERACTION_NO),
-                av=metrics.get('AV', cls.THREAT_VECTOR_UNDEFINED)
-            )
-            
-            # Local environment metrics
-            calculator.set_local_environment_metrics(
-                la=metrics.get('LA', cls.ASSET_ACCESS_LOCAL_NETWORK),
-                cp=metrics.get('CP', cls.NETWORK_SEGMENTATION_NONE)
-            )
-            
-            # Process consequences
-            calculator.set_process_consequence_metrics(
-                vi=metrics.get('VI', cls.PROCESS_VISIBILITY_NONE),
-                mi=metrics.get('MI', cls.PROCESS_MONITORING_NONE),
-                ci=metrics.get('CI', cls.PROCESS_CONTROL_NONE)
-            )
-            
-            # Impact metrics
-            calculator.set_impact_metrics(
-                pi=metrics.get('PI', cls.SYSTEM_PRODUCTION_IMPACT_NOT_DEFINED),
-                ri=metrics.get('RI', cls.SYSTEM_RELIABILITY_IMPACT_NOT_DEFINED),
-                si=metrics.get('SI', cls.SYSTEM_SAFETY_IMPACT_NOT_DEFINED),
-                cd=metrics.get('CD', cls.FINANCIAL_LOSS_IMPACT_NOT_DEFINED)
-            )
+            # Set metrics, with defaults for any not in the vector
+            calculator._update_metrics({**_DEFAULT_METRICS, **metrics})
             
             return calculator
         
@@ -608,164 +607,216 @@ class IVSSCalculator:
 
     def to_vector_string(self):
         """Convert current metrics to IVSS vector string."""
-        parts = ["IVSS:1.0"]
-        
-        # Add base metrics
-        for metric in ['RC', 'BC', 'RL', 'EC', 'EX', 'AU', 'UI', 'AV']:
-            if self.metrics[metric] is not None:
-                parts.append(f"{metric}:{self._get_metric_key(metric)}")
-        
-        # Add environmental metrics
-        for metric in ['LA', 'CP', 'VI', 'MI', 'CI', 'PI', 'RI', 'SI', 'CD']:
-            if self.metrics[metric] is not None:
-                parts.append(f"{metric}:{self._get_metric_key(metric)}")
-        
-        return "/".join(parts)
+        # The metrics dict can be changed directly, so the cached string is
+        # only reused while the metric values it was built from are unchanged
+        values = _metric_values(self.metrics)
+        cached = self._vector_cache
+        if cached is not None and cached[0] == values:
+            return cached[1]
+        
+        # Every metric that is set, in vector order
+        key_map = _METRIC_KEY_MAP
+        vector_string = "/".join(["IVSS:1.0", *(f"{metric}:{key_map[metric].get(value, str(value))}"
+                                                for metric, value in zip(_METRIC_ORDER, values)
+                                                if value is not None)])
+        self._vector_cache = (values, vector_string)
+        return vector_string
         
     def _get_metric_key(self, metric):
         """Get key representation of a metric value."""
         value = self.metrics[metric]
         
-        # Comprehensive mappings from numerical values to key representations
-        mappings = {
-            # Report Confidence
-            'RC': {
-                self.REPORT_CONFIDENCE_UNCONFIRMED: 'U',
-                self.REPORT_CONFIDENCE_UNCORROBORATED: 'UC', 
-                self.REPORT_CONFIDENCE_CONFIRMED: 'C',
-                self.REPORT_CONFIDENCE_NOT_DEFINED: 'ND'
-            },
-            
-            # Consequence
-            'BC': {
-                self.CONSEQUENCE_TEMPORARY_DENIAL: 'TD',
-                self.CONSEQUENCE_DATA_MODIFICATION: 'DM',
-                self.CONSEQUENCE_SUSTAINED_DENIAL: 'SD',
-                self.CONSEQUENCE_CONTROL: 'C'
-            },
-            
-            # Remediation Level
-            'RL': {
-                self.REMEDIATION_LEVEL_OFFICIAL_FIX: 'OF',
-                self.REMEDIATION_LEVEL_WORKAROUND: 'W',
-                self.REMEDIATION_LEVEL_TEMPORARY_FIX: 'TF',
-                self.REMEDIATION_LEVEL_UNAVAILABLE: 'U',
-                self.REMEDIATION_LEVEL_NOT_DEFINED: 'ND'
-            },
-            
-            # Exploit Difficulty
-            'EC': {
-                self.EXPLOIT_DIFFICULTY_HIGH: 'H',
-                self.EXPLOIT_DIFFICULTY_MODERATE: 'M',
-                self.EXPLOIT_DIFFICULTY_LOW: 'L'
-            },
-            
-            # Exploit Maturity
-            'EX': {
-                self.EXPLOIT_MATURITY_UNPROVEN: 'U',
-                self.EXPLOIT_MATURITY_POC: 'POC',
-                self.EXPLOIT_MATURITY_FUNCTIONAL: 'F',
-                self.EXPLOIT_MATURITY_NOT_DEFINED: 'ND'
-            },
-            
-            # Privilege Level
-            'AU': {
-                self.PRIVILEGE_LEVEL_ADMIN_ROOT: 'AR',
-                self.PRIVILEGE_LEVEL_USER: 'U',
-                self.PRIVILEGE_LEVEL_NONE: 'N'
-            },
-            
-            # User Interaction
-            'UI': {
-                self.USER_INTERACTION_YES: 'Y',
-                self.USER_INTERACTION_NO: 'N'
-            },
-            
-            # Threat Vector
-            'AV': {
-                self.THREAT_VECTOR_LOCAL_HOST: 'LH',
-                self.THREAT_VECTOR_LOCAL_NETWORK: 'LN',
-                self.THREAT_VECTOR_ADJACENT_REMOTE: 'AR',
-                self.THREAT_VECTOR_UNDEFINED: 'U'
-            },
-            
-            # Asset Access
-            'LA': {
-                self.ASSET_ACCESS_LOCAL_HOST: 'LH',
-                self.ASSET_ACCESS_LOCAL_NETWORK: 'LN',
-                self.ASSET_ACCESS_ADJACENT_REMOTE: 'AR'
-            },
-            
-            # Network Segmentation
-            'CP': {
-                self.NETWORK_SEGMENTATION_COMPLIANT: 'C',
-                self.NETWORK_SEGMENTATION_PARTIAL: 'P',
-                self.NETWORK_SEGMENTATION_DMZ_ONLY: 'D',
-                self.NETWORK_SEGMENTATION_NONE: 'N'
-            },
-            
-            # Process Visibility
-            'VI': {
-                self.PROCESS_VISIBILITY_NONE: 'N',
-                self.PROCESS_VISIBILITY_PARTIAL: 'P',
-                self.PROCESS_VISIBILITY_COMPLETE: 'C'
-            },
-            
-            # Process Monitoring
-            'MI': {
-                self.PROCESS_MONITORING_NONE: 'N',
-                self.PROCESS_MONITORING_PARTIAL: 'P',
-                self.PROCESS_MONITORING_COMPLETE: 'C'
-            },
-            
-            # Process Control
-            'CI': {
-                self.PROCESS_CONTROL_NONE: 'N',
-                self.PROCESS_CONTROL_PARTIAL: 'P',
-                self.PROCESS_CONTROL_COMPLETE: 'C'
-            },
-            
-            # System Production Impact
-            'PI': {
-                self.SYSTEM_PRODUCTION_IMPACT_NONE: 'N',
-                self.SYSTEM_PRODUCTION_IMPACT_LOW: 'L',
-                self.SYSTEM_PRODUCTION_IMPACT_MEDIUM: 'M',
-                self.SYSTEM_PRODUCTION_IMPACT_HIGH: 'H',
-                self.SYSTEM_PRODUCTION_IMPACT_NOT_DEFINED: 'ND'
-            },
-            
-            # System Reliability Impact
-            'RI': {
-                self.SYSTEM_RELIABILITY_IMPACT_NONE: 'N',
-                self.SYSTEM_RELIABILITY_IMPACT_LOW: 'L',
-                self.SYSTEM_RELIABILITY_IMPACT_MEDIUM: 'M',
-                self.SYSTEM_RELIABILITY_IMPACT_HIGH: 'H',
-                self.SYSTEM_RELIABILITY_IMPACT_NOT_DEFINED: 'ND'
-            },
-            
-            # System Safety Impact
-            'SI': {
-                self.SYSTEM_SAFETY_IMPACT_NONE: 'N',
-                self.SYSTEM_SAFETY_IMPACT_LOW: 'L',
-                self.SYSTEM_SAFETY_IMPACT_MEDIUM: 'M',
-                self.SYSTEM_SAFETY_IMPACT_HIGH: 'H',
-                self.SYSTEM_SAFETY_IMPACT_NOT_DEFINED: 'ND'
-            },
-            
-            # Financial Loss Impact
-            'CD': {
-                self.FINANCIAL_LOSS_IMPACT_NONE: 'N',
-                self.FINANCIAL_LOSS_IMPACT_LOW: 'L',
-                self.FINANCIAL_LOSS_IMPACT_LOW_MEDIUM: 'LM',
-                self.FINANCIAL_LOSS_IMPACT_MEDIUM_HIGH: 'MH',
-                self.FINANCIAL_LOSS_IMPACT_HIGH: 'H',
-                self.FINANCIAL_LOSS_IMPACT_NOT_DEFINED: 'ND'
-            }
-        }
-        
-        # Check if metric has mapping and value exists
-        if metric in mappings and value in mappings[metric]:
-            return mappings[metric][value]
-        
         # Return value as string if no specific mapping found
-        return str(value)
\ No newline at end of file
+        return _METRIC_KEY_MAP[metric].get(value, str(value))
+
+
+def _reverse_metric_map(cls):
+    """Map the vector string codes of each metric to its values."""
+    return {
+        # Base metrics
+        'RC': {
+            'U': cls.REPORT_CONFIDENCE_UNCONFIRMED,
+            'UC': cls.REPORT_CONFIDENCE_UNCORROBORATED,
+            'C': cls.REPORT_CONFIDENCE_CONFIRMED,
+            'ND': cls.REPORT_CONFIDENCE_NOT_DEFINED
+        },
+        'BC': {
+            'TD': cls.CONSEQUENCE_TEMPORARY_DENIAL,
+            'DM': cls.CONSEQUENCE_DATA_MODIFICATION,
+            'SD': cls.CONSEQUENCE_SUSTAINED_DENIAL,
+            'C': cls.CONSEQUENCE_CONTROL
+        },
+        'RL': {
+            'OF': cls.REMEDIATION_LEVEL_OFFICIAL_FIX,
+            'W': cls.REMEDIATION_LEVEL_WORKAROUND,
+            'TF': cls.REMEDIATION_LEVEL_TEMPORARY_FIX,
+            'U': cls.REMEDIATION_LEVEL_UNAVAILABLE,
+            'ND': cls.REMEDIATION_LEVEL_NOT_DEFINED
+        },
+        'EC': {
+            'H': cls.EXPLOIT_DIFFICULTY_HIGH,
+            'M': cls.EXPLOIT_DIFFICULTY_MODERATE,
+            'L': cls.EXPLOIT_DIFFICULTY_LOW
+        },
+        'EX': {
+            'U': cls.EXPLOIT_MATURITY_UNPROVEN,
+            'POC': cls.EXPLOIT_MATURITY_POC,
+            'F': cls.EXPLOIT_MATURITY_FUNCTIONAL,
+            'ND': cls.EXPLOIT_MATURITY_NOT_DEFINED
+        },
+        'AU': {
+            'AR': cls.PRIVILEGE_LEVEL_ADMIN_ROOT,
+            'U': cls.PRIVILEGE_LEVEL_USER,
+            'N': cls.PRIVILEGE_LEVEL_NONE
+        },
+        'UI': {
+            'Y': cls.USER_INTERACTION_YES,
+            'N': cls.USER_INTERACTION_NO
+        },
+        'AV': {
+            'LH': cls.THREAT_VECTOR_LOCAL_HOST,
+            'LN': cls.THREAT_VECTOR_LOCAL_NETWORK,
+            'AR': cls.THREAT_VECTOR_ADJACENT_REMOTE,
+            'U': cls.THREAT_VECTOR_UNDEFINED
+        },
+        
+        # Local environment metrics
+        'LA': {
+            'LH': cls.ASSET_ACCESS_LOCAL_HOST,
+            'LN': cls.ASSET_ACCESS_LOCAL_NETWORK,
+            'AR': cls.ASSET_ACCESS_ADJACENT_REMOTE
+        },
+        'CP': {
+            'C': cls.NETWORK_SEGMENTATION_COMPLIANT,
+            'P': cls.NETWORK_SEGMENTATION_PARTIAL,
+            'D': cls.NETWORK_SEGMENTATION_DMZ_ONLY,
+            'N': cls.NETWORK_SEGMENTATION_NONE
+        },
+        
+        # Process consequence metrics
+        'VI': {
+            'N': cls.PROCESS_VISIBILITY_NONE,
+            'P': cls.PROCESS_VISIBILITY_PARTIAL,
+            'C': cls.PROCESS_VISIBILITY_COMPLETE
+        },
+        'MI': {
+            'N': cls.PROCESS_MONITORING_NONE,
+            'P': cls.PROCESS_MONITORING_PARTIAL,
+            'C': cls.PROCESS_MONITORING_COMPLETE
+        },
+        'CI': {
+            'N': cls.PROCESS_CONTROL_NONE,
+            'P': cls.PROCESS_CONTROL_PARTIAL,
+            'C': cls.PROCESS_CONTROL_COMPLETE
+        },
+        
+        # Impact metrics
+        'PI': {
+            'N': cls.SYSTEM_PRODUCTION_IMPACT_NONE,
+            'L': cls.SYSTEM_PRODUCTION_IMPACT_LOW,
+            'M': cls.SYSTEM_PRODUCTION_IMPACT_MEDIUM,
+            'H': cls.SYSTEM_PRODUCTION_IMPACT_HIGH,
+            'ND': cls.SYSTEM_PRODUCTION_IMPACT_NOT_DEFINED
+        },
+        'RI': {
+            'N': cls.SYSTEM_RELIABILITY_IMPACT_NONE,
+            'L': cls.SYSTEM_RELIABILITY_IMPACT_LOW,
+            'M': cls.SYSTEM_RELIABILITY_IMPACT_MEDIUM,
+            'H': cls.SYSTEM_RELIABILITY_IMPACT_HIGH,
+            'ND': cls.SYSTEM_RELIABILITY_IMPACT_NOT_DEFINED
+        },
+        'SI': {
+            'N': cls.SYSTEM_SAFETY_IMPACT_NONE,
+            'L': cls.SYSTEM_SAFETY_IMPACT_LOW,
+            'M': cls.SYSTEM_SAFETY_IMPACT_MEDIUM,
+            'H': cls.SYSTEM_SAFETY_IMPACT_HIGH,
+            'ND': cls.SYSTEM_SAFETY_IMPACT_NOT_DEFINED
+        },
+        'CD': {
+            'N': cls.FINANCIAL_LOSS_IMPACT_NONE,
+            'L': cls.FINANCIAL_LOSS_IMPACT_LOW,
+            'LM': cls.FINANCIAL_LOSS_IMPACT_LOW_MEDIUM,
+            'MH': cls.FINANCIAL_LOSS_IMPACT_MEDIUM_HIGH,
+            'H': cls.FINANCIAL_LOSS_IMPACT_HIGH,
+            'ND': cls.FINANCIAL_LOSS_IMPACT_NOT_DEFINED
+        }
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _final_scores(values, use_external, external_score):
+    """
+    Compute every IVSS sub-score and the final score in one pass.
+
+    Args:
+        values: Metric values in _METRIC_ORDER
+        use_external: Whether external_score replaces the Base Severity
+        external_score: External CVSS score, or None
+
+    Returns:
+        tuple: (score name, score) pairs for updating IVSSCalculator.scores;
+        BS is left out when an external CVSS score is used
+    """
+    rc, bc, rl, ec, ex, au, ui, av, la, cp, vi, mi, ci, pi, ri, si, cd = values
+    
+    # Check in the order the individual calculations would
+    if not use_external and None in (rc, bc, rl):
+        raise ValueError("All base severity metrics must be set")
+    if None in (vi, mi, ci):
+        raise ValueError("All process consequence metrics must be set")
+    if None in (pi, ri, si, cd):
+        raise ValueError("All impact metrics must be set")
+    if la is None:
+        raise ValueError("Asset Access metric must be set")
+    if None in (ec, ex, au, ui):
+        raise ValueError("All exploitability metrics must be set")
+    if cp is None:
+        raise ValueError("All local accessibility metrics must be set")
+    
+    # Every sub-score in one pass, with the formulas of the individual methods
+    bs = external_score if use_external else (rc + bc * 3 + rl) * 2.5
+    bex = (ec + ex + au + ui) * 2.5
+    local_acc = (la * cp) * 10
+    con = ((vi + mi + ci * 3) / 5) * 10
+    imp = (cd * 5 * pi * 2 + ri + si * 6) / 14 * 10
+    adj_acc = la * 10
+    adj_imp = (con + (imp * 2)) / 3
+    score = (bs + adj_imp * 5 + adj_acc * 10) * 0.0625
+    
+    scores = {'BEX': bex, 'ACC': local_acc, 'CON': con, 'IMP': imp,
+              'ADJACC': adj_acc, 'ADJIMP': adj_imp, 'FINAL': score}
+    if not use_external:
+        scores['BS'] = bs
+    
+    return tuple(scores.items())
+
+
+# Vector string codes to metric values, built once at import. The forward map
+# keeps the last code for values shared by several codes (e.g. RC:C and RC:ND).
+_REVERSE_METRIC_MAP = _reverse_metric_map(IVSSCalculator)
+_METRIC_KEY_MAP = {metric: {value: code for code, value in codes.items()}
+                   for metric, codes in _REVERSE_METRIC_MAP.items()}
+# The same table flattened to (metric, code) -> value for parsing
+_CODE_VALUES = {(metric, code): value
+                for metric, codes in _REVERSE_METRIC_MAP.items() for code, value in codes.items()}
+
+# Values of metrics left out of a parsed vector string
+_DEFAULT_METRICS = {
+    'RC': IVSSCalculator.REPORT_CONFIDENCE_NOT_DEFINED,
+    'BC': IVSSCalculator.CONSEQUENCE_CONTROL,
+    'RL': IVSSCalculator.REMEDIATION_LEVEL_NOT_DEFINED,
+    'EC': IVSSCalculator.EXPLOIT_DIFFICULTY_LOW,
+    'EX': IVSSCalculator.EXPLOIT_MATURITY_NOT_DEFINED,
+    'AU': IVSSCalculator.PRIVILEGE_LEVEL_NONE,
+    'UI': IVSSCalculator.USER_INTERACTION_NO,
+    'AV': IVSSCalculator.THREAT_VECTOR_UNDEFINED,
+    'LA': IVSSCalculator.ASSET_ACCESS_LOCAL_NETWORK,
+    'CP': IVSSCalculator.NETWORK_SEGMENTATION_NONE,
+    'VI': IVSSCalculator.PROCESS_VISIBILITY_NONE,
+    'MI': IVSSCalculator.PROCESS_MONITORING_NONE,
+    'CI': IVSSCalculator.PROCESS_CONTROL_NONE,
+    'PI': IVSSCalculator.SYSTEM_PRODUCTION_IMPACT_NOT_DEFINED,
+    'RI': IVSSCalculator.SYSTEM_RELIABILITY_IMPACT_NOT_DEFINED,
+    'SI': IVSSCalculator.SYSTEM_SAFETY_IMPACT_NOT_DEFINED,
+    'CD': IVSSCalculator.FINANCIAL_LOSS_IMPACT_NOT_DEFINED,
+}
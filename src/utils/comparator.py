@@ -5,11 +5,17 @@ Provides tools for comparing CVSS and IVSS vulnerability scoring systems.
 """
 
 import json
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from src.scoring.cvss_calculator import CVSSv4Calculator
-from src.scoring.ivss_extension import IVSSCalculator
+from collections import Counter
+
+import numpy as np
+
+from ..scoring.cvss_calculator import CVSSv4Calculator
+from ..scoring.ivss_extension import IVSSCalculator
+
+# Lower bounds of the Low, Medium, High and Critical ratings, as used by
+# _get_severity_category
+_SEVERITY_BINS = np.array([0.1, 4.0, 7.0, 9.0])
+_SEVERITY_LABELS = ("None", "Low", "Medium", "High", "Critical")
 
 
 class VulnerabilityComparator:
@@ -18,8 +24,21 @@ class VulnerabilityComparator:
         self.cvss_calculator = CVSSv4Calculator()
         self.ivss_calculator = IVSSCalculator()
         self.results = []
+        
+        # Parallel columns of self.results, see _score_columns
+        self._columns_source = self.results
+        self._ids = []
+        self._cvss_scores = []
+        self._ivss_scores = []
+        
+        # Assessments recorded with defer_details, see finalize_details
+        self._deferred = []
+        
+        # (results list, its length, value) for _score_arrays and analyse_results
+        self._arrays_cache = None
+        self._analysis_cache = None
     
-    def assess_vulnerability(self, vuln_id, description, cvss_params, ivss_params):
+    def assess_vulnerability(self, vuln_id, description, cvss_params, ivss_params, defer_details=False):
         """
         Assess vulnerability using both methodologies.
         
@@ -28,54 +47,75 @@ class VulnerabilityComparator:
         - description: Description of vulnerability
         - cvss_params: Dictionary of CVSS parameters or initialized CVSSv4Calculator
         - ivss_params: Dictionary of IVSS parameters or initialized IVSSCalculator
+        - defer_details: Only record the scores and vectors now and build the
+          result dict, comparison included, in finalize_details
         
         Returns:
-        - Dictionary with assessment results
+        - Dictionary with assessment results, or (cvss_score, ivss_score) when
+          defer_details is set
         """
         # Handle different types of inputs for CVSS
         if isinstance(cvss_params, CVSSv4Calculator):
             # Use the provided calculator directly
-            self.cvss_calculator = cvss_params
+            cvss_calculator = cvss_params
         else:
             # Handle dictionary of parameters
-            self.cvss_calculator = CVSSv4Calculator()
-            if 'base_metrics' in cvss_params:
-                self.cvss_calculator.set_base_metrics(**cvss_params.get('base_metrics', {}))
-            if 'threat_metrics' in cvss_params:
-                self.cvss_calculator.set_threat_metrics(**cvss_params.get('threat_metrics', {}))
-            if 'environmental_metrics' in cvss_params:
-                self.cvss_calculator.set_environmental_metrics(**cvss_params.get('environmental_metrics', {}))
+            cvss_calculator = CVSSv4Calculator()
+            metrics = cvss_params.get('base_metrics')
+            if metrics is not None:
+                cvss_calculator.set_base_metrics(**metrics)
+            metrics = cvss_params.get('threat_metrics')
+            if metrics is not None:
+                cvss_calculator.set_threat_metrics(**metrics)
+            # Every environmental metric is optional, so an empty dict sets nothing
+            metrics = cvss_params.get('environmental_metrics')
+            if metrics:
+                cvss_calculator.set_environmental_metrics(**metrics)
             
         # Calculate CVSS score
-        cvss_score = self.cvss_calculator.calculate_base_score()
-        cvss_vector = self.cvss_calculator.to_vector_string()
+        cvss_score = cvss_calculator.calculate_base_score()
         
         # Handle different types of inputs for IVSS
         if isinstance(ivss_params, IVSSCalculator):
             # Use the provided calculator directly
-            self.ivss_calculator = ivss_params
+            ivss_calculator = ivss_params
         else:
             # Handle dictionary of parameters
-            self.ivss_calculator = IVSSCalculator()
+            ivss_calculator = IVSSCalculator()
             # Option 1: Use CVSS score as base for IVSS
             if ivss_params.get('use_cvss_base', False):
-                self.ivss_calculator.set_cvss_base_score(cvss_score)
+                ivss_calculator.set_cvss_base_score(cvss_score)
             # Option 2: Calculate IVSS independently
             else:
-                if 'base_metrics' in ivss_params:
-                    self.ivss_calculator.set_base_metrics(**ivss_params.get('base_metrics', {}))
+                metrics = ivss_params.get('base_metrics')
+                if metrics is not None:
+                    ivss_calculator.set_base_metrics(**metrics)
             
             # Set IVSS-specific parameters
-            if 'local_environment' in ivss_params:
-                self.ivss_calculator.set_local_environment_metrics(**ivss_params.get('local_environment', {}))
-            if 'process_consequences' in ivss_params:
-                self.ivss_calculator.set_process_consequence_metrics(**ivss_params.get('process_consequences', {}))
-            if 'impact_metrics' in ivss_params:
-                self.ivss_calculator.set_impact_metrics(**ivss_params.get('impact_metrics', {}))
+            metrics = ivss_params.get('local_environment')
+            if metrics is not None:
+                ivss_calculator.set_local_environment_metrics(**metrics)
+            metrics = ivss_params.get('process_consequences')
+            if metrics is not None:
+                ivss_calculator.set_process_consequence_metrics(**metrics)
+            metrics = ivss_params.get('impact_metrics')
+            if metrics is not None:
+                ivss_calculator.set_impact_metrics(**metrics)
         
         # Calculate IVSS score
-        ivss_score = self.ivss_calculator.calculate_final_score()
-        ivss_vector = self.ivss_calculator.to_vector_string()
+        ivss_score = ivss_calculator.calculate_final_score()
+        self.cvss_calculator = cvss_calculator
+        self.ivss_calculator = ivss_calculator
+        
+        if defer_details:
+            # Calculators may be reused for the next assessment, so keep their
+            # vectors and a copy of the detailed scores rather than the calculators
+            self._deferred.append((vuln_id, description, cvss_score, ivss_score,
+                                   cvss_calculator.to_vector_string(),
+                                   ivss_calculator.to_vector_string(), dict(ivss_calculator.scores)))
+            return cvss_score, ivss_score
+        
+        ivss_vector = ivss_calculator.to_vector_string()
         
         # Create result with all calculated scores
         result = {
@@ -83,12 +123,12 @@ class VulnerabilityComparator:
             'description': description,
             'cvss': {
                 'score': cvss_score,
-                'vector': cvss_vector,
+                'vector': cvss_calculator.to_vector_string(),
             },
             'ivss': {
                 'score': ivss_score,
                 'vector': ivss_vector,
-                'detailed_scores': self.ivss_calculator.scores
+                'detailed_scores': ivss_calculator.scores
             },
             'comparison': {
                 'absolute_difference': abs(cvss_score - ivss_score),
@@ -97,7 +137,12 @@ class VulnerabilityComparator:
             }
         }
         
+        ids, cvss_scores, ivss_scores = self._score_columns()
+        ids.append(vuln_id)
+        cvss_scores.append(cvss_score)
+        ivss_scores.append(ivss_score)
         self.results.append(result)
+        self._analysis_cache = None
         return result
     
     def _determine_severity_shift(self, cvss_score, ivss_score):
@@ -136,27 +181,40 @@ class VulnerabilityComparator:
         """
         Analyse comparison results and generate statistics.
         
+        The statistics are cached; call invalidate_caches after replacing a
+        result or editing scores in place.
+        
         Returns:
         - Dictionary with analysis results
         """
+        self.finalize_details()
         if not self.results:
             return {"error": "No vulnerabilities assessed yet"}
         
-        # Count severity shifts
-        severity_shifts = {}
-        for result in self.results:
-            shift = result['comparison']['severity_shift']
-            severity_shifts[shift] = severity_shifts.get(shift, 0) + 1
-        
-        # Calculate averages
-        avg_cvss = sum(r['cvss']['score'] for r in self.results) / len(self.results)
-        avg_ivss = sum(r['ivss']['score'] for r in self.results) / len(self.results)
-        avg_diff = sum(r['comparison']['absolute_difference'] for r in self.results) / len(self.results)
-        avg_pct_diff = sum(r['comparison']['percentage_difference'] for r in self.results) / len(self.results)
+        # Reuse the statistics until results are added or replaced. The dict is
+        # built fresh on every call, so callers may change what they get back
+        cached = self._analysis_cache
+        if cached is None or cached[0] is not self.results or cached[1] != len(self.results):
+            cvss, ivss = self._score_arrays()
+            diff, pct, pair_codes = _compare_scores(cvss, ivss)
+            
+            # Count severity shifts, naming only the distinct (CVSS, IVSS) category pairs
+            severity_shifts = {}
+            for code, count in Counter(pair_codes.tolist()).items():
+                shift = _shift_label(*divmod(code, len(_SEVERITY_LABELS)))
+                severity_shifts[shift] = severity_shifts.get(shift, 0) + count
+            
+            # Calculate averages, summing left to right as the builtin sum() does
+            totals = np.cumsum([cvss, ivss, diff, pct], axis=1)[:, -1]
+            averages = (totals / len(self.results)).tolist()
+            
+            # Find vulnerabilities with largest differences
+            largest = _largest_indices(diff, 5)
+            cached = self._analysis_cache = (self.results, len(self.results),
+                                             (averages, severity_shifts, largest))
         
-        # Find vulnerabilities with largest differences
-        sorted_by_diff = sorted(self.results, key=lambda r: r['comparison']['absolute_difference'], reverse=True)
-        largest_differences = sorted_by_diff[:5] if len(sorted_by_diff) >= 5 else sorted_by_diff
+        (avg_cvss, avg_ivss, avg_diff, avg_pct_diff), severity_shifts, largest = cached[2]
+        largest_differences = [self.results[i] for i in largest]
         
         return {
             "total_vulnerabilities": len(self.results),
@@ -166,7 +224,7 @@ class VulnerabilityComparator:
                 "difference": avg_diff,
                 "percentage_difference": avg_pct_diff
             },
-            "severity_shifts": severity_shifts,
+            "severity_shifts": dict(severity_shifts),
             "largest_differences": [
                 {
                     "id": r['id'],
@@ -179,18 +237,146 @@ class VulnerabilityComparator:
             ]
         }
     
-    def export_results_to_json(self, filename):
+    def finalize_details(self):
+        """
+        Build the result dicts of assessments made with defer_details.
+        
+        The comparisons of all pending assessments are computed in one
+        vectorised pass. analyse_results, the score arrays and the JSON export
+        call this themselves, so it only needs calling directly before reading
+        results.
+        
+        Returns:
+        - Number of results added
+        """
+        if not self._deferred:
+            return 0
+        pending, self._deferred = self._deferred, []
+        
+        ids, cvss_scores, ivss_scores = self._score_columns()
+        cvss = np.array([p[2] for p in pending], dtype=np.float64)
+        ivss = np.array([p[3] for p in pending], dtype=np.float64)
+        comparisons = _comparison_dicts(cvss, ivss)
+        for (vuln_id, description, cvss_score, ivss_score, cvss_vector, ivss_vector, detailed_scores), comparison in zip(pending, comparisons):
+            ids.append(vuln_id)
+            cvss_scores.append(cvss_score)
+            ivss_scores.append(ivss_score)
+            self.results.append({
+                'id': vuln_id,
+                'description': description,
+                'cvss': {
+                    'score': cvss_score,
+                    'vector': cvss_vector,
+                },
+                'ivss': {
+                    'score': ivss_score,
+                    'vector': ivss_vector,
+                    'detailed_scores': detailed_scores
+                },
+                'comparison': comparison
+            })
+        self._analysis_cache = None
+        return len(pending)
+    
+    def recompute_comparisons_bulk(self):
+        """
+        Recompute the comparison block of every result from its stored scores.
+        
+        Intended for results whose scores were edited or loaded from an older
+        export; all rows are compared in one vectorised pass and the result
+        dicts are updated in place with the values assess_vulnerability would
+        give them.
+        
+        Returns:
+        - Number of results updated
+        """
+        # Scores may have been edited in place, so rebuild the columns
+        self.invalidate_caches()
+        if not self.results:
+            return 0
+        
+        for result, comparison in zip(self.results, _comparison_dicts(*self._score_arrays())):
+            result['comparison'] = comparison
+        return len(self.results)
+    
+    def invalidate_caches(self):
+        """
+        Drop the cached score columns, score arrays and analysis.
+        
+        They follow assess_vulnerability, and are rebuilt when results is
+        replaced or changes length, but a result replaced in place
+        (results[i] = {...}) or a score edited in a result dict goes unnoticed.
+        Call this, or recompute_comparisons_bulk, after such edits.
+        """
+        self._columns_source = None
+        self._arrays_cache = None
+        self._analysis_cache = None
+    
+    def score_arrays(self):
+        """
+        Vulnerability ids with the CVSS and IVSS scores of all results.
+        
+        Returns:
+        - Tuple of (list of ids, CVSS score array, IVSS score array). The ids
+          are a copy; the arrays are read-only and reused between calls until
+          results are added or replaced, or invalidate_caches is called
+        """
+        ids = list(self._score_columns()[0])
+        cvss, ivss = self._score_arrays()
+        return ids, cvss, ivss
+    
+    def _score_columns(self):
+        """
+        Ids, CVSS scores and IVSS scores of all results as parallel lists.
+        
+        assess_vulnerability keeps them in step with results; they are rebuilt
+        from the result dicts if results is replaced or its length changes, and
+        after invalidate_caches.
+        """
+        self.finalize_details()
+        if self._columns_source is not self.results or len(self._ids) != len(self.results):
+            self._columns_source = self.results
+            self._ids = [r['id'] for r in self.results]
+            self._cvss_scores = [r['cvss']['score'] for r in self.results]
+            self._ivss_scores = [r['ivss']['score'] for r in self.results]
+        return self._ids, self._cvss_scores, self._ivss_scores
+    
+    def _score_arrays(self):
+        """
+        CVSS and IVSS scores of all results as arrays.
+        
+        The arrays are rebuilt only when the results list is replaced or its
+        length changes, and after invalidate_caches.
+        """
+        cached = self._arrays_cache
+        if cached is None or cached[0] is not self.results or cached[1] != len(self.results):
+            _, cvss_scores, ivss_scores = self._score_columns()
+            cvss = np.array(cvss_scores, dtype=np.float64)
+            ivss = np.array(ivss_scores, dtype=np.float64)
+            # Handed out by score_arrays, so guard the cache against writes
+            cvss.setflags(write=False)
+            ivss.setflags(write=False)
+            cached = self._arrays_cache = (self.results, len(self.results), (cvss, ivss))
+        return cached[2]
+    
+    def export_results_to_json(self, filename, indent=2):
         """
         Export comparison results to JSON file.
         
         Parameters:
         - filename: Name of JSON file to create
+        - indent: Indentation passed to json, or None for compact output
+          without whitespace (encoded in one pass by the C encoder, much
+          faster for large exports)
         """
+        self.finalize_details()
         if not self.results:
             return False
             
+        # Encode in one go and write once rather than chunk by chunk
         with open(filename, 'w') as jsonfile:
-            json.dump(self.results, jsonfile, indent=2)
+            separators = (',', ':') if indent is None else None
+            jsonfile.write(json.dumps(self.results, indent=indent, separators=separators))
                 
         return True
     
@@ -204,6 +390,61 @@ class VulnerabilityComparator:
         try:
             with open(filename, 'r') as jsonfile:
                 self.results = json.load(jsonfile)
+            self._deferred = []
+            self._analysis_cache = None
             return True
         except (FileNotFoundError, json.JSONDecodeError):
-            return False
\ No newline at end of file
+            return False
+
+
+def _largest_indices(values, count):
+    """
+    Indices of the count largest values, largest first with ties in index order
+    as a stable descending sort gives them, without sorting every value.
+    """
+    if len(values) > count:
+        threshold = np.partition(values, len(values) - count)[len(values) - count]
+        candidates = np.flatnonzero(values >= threshold)
+    else:
+        candidates = np.arange(len(values))
+    order = np.argsort(-values[candidates], kind='stable')
+    return candidates[order[:count]].tolist()
+
+
+def _compare_scores(cvss, ivss):
+    """
+    Absolute differences, percentage differences and severity category pair
+    codes (CVSS index * len(_SEVERITY_LABELS) + IVSS index) of two score arrays.
+    """
+    diff = np.abs(cvss - ivss)
+    maxes = np.maximum(cvss, ivss)
+    pct = np.zeros_like(diff)
+    np.divide(diff, maxes, out=pct, where=maxes > 0)
+    pct *= 100
+    pair_codes = np.digitize(cvss, _SEVERITY_BINS) * len(_SEVERITY_LABELS) + np.digitize(ivss, _SEVERITY_BINS)
+    return diff, pct, pair_codes
+
+
+def _comparison_dicts(cvss, ivss):
+    """Comparison blocks, as assess_vulnerability builds them, for two score arrays."""
+    diff, pct, pair_codes = _compare_scores(cvss, ivss)
+    labels = {}
+    comparisons = []
+    for difference, percentage, positive, code in zip(
+            diff.tolist(), pct.tolist(), (np.maximum(cvss, ivss) > 0).tolist(), pair_codes.tolist()):
+        shift = labels.get(code)
+        if shift is None:
+            shift = labels[code] = _shift_label(*divmod(code, len(_SEVERITY_LABELS)))
+        comparisons.append({
+            'absolute_difference': difference,
+            'percentage_difference': percentage if positive else 0,
+            'severity_shift': shift,
+        })
+    return comparisons
+
+
+def _shift_label(cvss_category, ivss_category):
+    """Severity shift description for a pair of _SEVERITY_LABELS indices."""
+    if cvss_category == ivss_category:
+        return "No change"
+    return f"{_SEVERITY_LABELS[cvss_category]} → {_SEVERITY_LABELS[ivss_category]}"
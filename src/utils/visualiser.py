@@ -5,14 +5,42 @@ Provides data visualisation for comparing CVSS and IVSS scoring results,
 including comparative charts, distribution analysis, and interactive dashboards.
 """
 
+import os
+
 import matplotlib.pyplot as plt
+from matplotlib import font_manager
+from matplotlib.patches import Patch
 import numpy as np
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from src.utils.comparator import VulnerabilityComparator
+from .comparator import VulnerabilityComparator
+
+_STYLE_INITIALISED = False
+
+
+def _preferred_font_family():
+    """
+    Arial if it is installed, otherwise the default sans-serif fonts.
+    
+    Looked up once, so a missing Arial does not make every text draw fall
+    back, and warn, on its own.
+    """
+    try:
+        font_manager.findfont(font_manager.FontProperties(family='Arial'), fallback_to_default=False)
+    except ValueError:
+        return 'sans-serif'
+    return 'Arial'
+
 
 class VulnerabilityVisualisation:
+    # Colormaps looked up once and shared by every plot
+    _COOLWARM = plt.get_cmap('coolwarm')
+    _PAIRED = plt.get_cmap('Paired')
+    
+    # Score distribution bin edges, 0-10 range with 1-point bins
+    _HISTOGRAM_EDGES = np.linspace(0, 10, 11)
+    
+    # Critical, High and Medium score thresholds
+    _SEVERITY_THRESHOLDS = (9.0, 7.0, 4.0)
+    
     def __init__(self, comparator=None):
         self.comparator = comparator or VulnerabilityComparator()
         
@@ -24,12 +52,21 @@ class VulnerabilityVisualisation:
             'text': '#2C3E50'       
         }
         
-        plt.style.use('seaborn-v0_8-whitegrid')
-        self._set_custom_style()
+        # Dashboard figure, axes and scatter colourbar kept for reuse
+        self._dash_fig = None
+        self._dash_axes = None
+        self._dash_colorbar = None
+        
+        # rcParams are global, so the style only needs applying once
+        global _STYLE_INITIALISED
+        if not _STYLE_INITIALISED:
+            plt.style.use('seaborn-v0_8-whitegrid')
+            self._set_custom_style()
+            _STYLE_INITIALISED = True
     
     def _set_custom_style(self):
         plt.rcParams['figure.figsize'] = (14, 10)
-        plt.rcParams['font.family'] = 'Arial'
+        plt.rcParams['font.family'] = _preferred_font_family()
         plt.rcParams['font.size'] = 10
         plt.rcParams['axes.labelsize'] = 12
         plt.rcParams['axes.titlesize'] = 14
@@ -41,58 +78,51 @@ class VulnerabilityVisualisation:
         plt.rcParams['figure.facecolor'] = self.colours['background']
         plt.rcParams['axes.facecolor'] = 'white'
     
-    def plot_score_comparison(self, save_path=None):
+    def _get_arrays(self):
+        """Vulnerability ids with CVSS and IVSS score arrays for the current results."""
+        return self.comparator.score_arrays()
+    
+    def plot_score_comparison(self, save_path=None, dpi=300, bbox_inches='tight'):
         if not self.comparator.results:
             print("No results available for visualisation")
             return
         
-        vulnerability_ids = [r['id'] for r in self.comparator.results]
-        cvss_scores = [r['cvss']['score'] for r in self.comparator.results]
-        ivss_scores = [r['ivss']['score'] for r in self.comparator.results]
+        vulnerability_ids, cvss_scores, ivss_scores = self._get_arrays()
         
         fig, ax = plt.subplots(figsize=(14, 8))
         bar_width = 0.35
         x = np.arange(len(vulnerability_ids))
         
-        ax.bar(x - bar_width/2, cvss_scores, bar_width, label='CVSS', color=self.colours['cvss'], alpha=0.8)
-        ax.bar(x + bar_width/2, ivss_scores, bar_width, label='IVSS', color=self.colours['ivss'], alpha=0.8)
+        self._draw_score_bars(ax, x, bar_width, cvss_scores, ivss_scores)
         
         ax.set_xlabel('Vulnerability ID', fontweight='bold')
         ax.set_ylabel('Score', fontweight='bold')
         ax.set_title('CVSS vs IVSS Score Comparison', fontweight='bold')
         ax.set_xticks(x)
         ax.set_xticklabels(vulnerability_ids, rotation=45, ha='right')
-        ax.legend()
         
-        ax.axhline(y=9.0, linestyle='--', color='gray', alpha=0.5, label='Critical')
-        ax.axhline(y=7.0, linestyle='--', color='gray', alpha=0.5, label='High')
-        ax.axhline(y=4.0, linestyle='--', color='gray', alpha=0.5, label='Medium')
+        self._draw_severity_thresholds(ax, horizontal=True)
         
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=dpi, bbox_inches=bbox_inches)
             
         return fig, ax
     
-    def plot_score_distribution(self, save_path=None):
+    def plot_score_distribution(self, save_path=None, dpi=300, bbox_inches='tight'):
         if not self.comparator.results:
             print("No results available for visualisation")
             return
         
-        cvss_scores = [r['cvss']['score'] for r in self.comparator.results]
-        ivss_scores = [r['ivss']['score'] for r in self.comparator.results]
-        ivss_scores = [min(s, 10.0) for s in ivss_scores]
+        _, cvss_scores, ivss_scores = self._get_arrays()
+        ivss_scores = np.minimum(ivss_scores, 10.0)
         
         fig, ax = plt.subplots(figsize=(12, 8))
         
-        bins = np.linspace(0, 10, 11)
-        ax.hist(cvss_scores, bins=bins, alpha=0.5, label='CVSS', color=self.colours['cvss'])
-        ax.hist(ivss_scores, bins=bins, alpha=0.5, label='IVSS', color=self.colours['ivss'])
+        self._draw_score_histograms(ax, cvss_scores, ivss_scores)
         
-        ax.axvline(x=9.0, linestyle='--', color='gray', alpha=0.7)
-        ax.axvline(x=7.0, linestyle='--', color='gray', alpha=0.7)
-        ax.axvline(x=4.0, linestyle='--', color='gray', alpha=0.7)
+        self._draw_severity_thresholds(ax, vertical=True, alpha=0.7)
         
         ax.set_xlabel('Score', fontweight='bold')
         ax.set_ylabel('Frequency', fontweight='bold')
@@ -102,11 +132,11 @@ class VulnerabilityVisualisation:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=dpi, bbox_inches=bbox_inches)
             
         return fig, ax
     
-    def plot_severity_shifts(self, save_path=None):
+    def plot_severity_shifts(self, save_path=None, dpi=300, bbox_inches='tight'):
         if not self.comparator.results:
             print("No results available for visualisation")
             return
@@ -125,7 +155,7 @@ class VulnerabilityVisualisation:
             sizes = list(shifts.values())
             
             # Create colourmap
-            colours = plt.cm.Paired(np.linspace(0, 1, len(labels)))
+            colours = self._PAIRED(np.linspace(0, 1, len(labels)))
             
             wedges, texts, autotexts = ax.pie(
                 sizes, 
@@ -153,27 +183,24 @@ class VulnerabilityVisualisation:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=dpi, bbox_inches=bbox_inches)
             
         return fig, ax
         
-    def plot_scatter_correlation(self, save_path=None):
+    def plot_scatter_correlation(self, save_path=None, dpi=300, bbox_inches='tight'):
         if not self.comparator.results:
             print("No results available for visualisation")
             return
         
-        cvss_scores = [r['cvss']['score'] for r in self.comparator.results]
-        ivss_scores = [r['ivss']['score'] for r in self.comparator.results]
+        _, cvss_scores, ivss_scores = self._get_arrays()
         
         fig, ax = plt.subplots(figsize=(12, 12), dpi=100)
         
-        cmap = plt.cm.get_cmap('coolwarm')
-        
         scatter = ax.scatter(
             cvss_scores, 
             ivss_scores, 
-            c=np.abs(np.array(cvss_scores) - np.array(ivss_scores)), 
-            cmap=cmap,
+            c=np.abs(cvss_scores - ivss_scores), 
+            cmap=self._COOLWARM,
             s=100,
             alpha=0.7,
             edgecolors='darkgray',
@@ -194,115 +221,169 @@ class VulnerabilityVisualisation:
         ax.set_xlim(0, 11)
         ax.set_ylim(0, 11)
         
-        threshold_style = {'linestyle': '--', 'color': 'gray', 'alpha': 0.5}
-        ax.axhline(y=9.0, **threshold_style)
-        ax.axhline(y=7.0, **threshold_style)
-        ax.axhline(y=4.0, **threshold_style)
-        ax.axvline(x=9.0, **threshold_style)
-        ax.axvline(x=7.0, **threshold_style)
-        ax.axvline(x=4.0, **threshold_style)
+        self._draw_severity_thresholds(ax, horizontal=True, vertical=True)
         
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=dpi, bbox_inches=bbox_inches)
             
         return fig, ax
     
-    def create_dashboard(self, save_path=None):
+    def create_dashboard(self, save_path=None, dpi=300, bbox_inches='tight'):
         """
         Create comprehensive dashboard with multiple visualisations.
         
         Parameters:
         - save_path: Optional path to save figure
+        - dpi: Resolution of the saved figure
+        - bbox_inches: Passed to savefig; None skips the extra layout pass
+          that 'tight' needs
         """
         if not self.comparator.results:
             print("No results available for visualisation")
             return
         
-        # Create figure with subplots
-        fig = plt.figure(figsize=(22, 16))
-        
-        # Define grid for subplots
-        gs = fig.add_gridspec(3, 2, 
-                            hspace=0.5,
-                            wspace=0.4,
-                            height_ratios=[1.2, 1, 1],
-                            top=0.93,
-                            bottom=0.07)
+        # Reuse the dashboard figure and axes while it is still open
+        if self._dash_fig is not None and plt.fignum_exists(self._dash_fig.number):
+            fig = self._dash_fig
+            ax1, ax2, ax3, ax4, ax5 = self._dash_axes
+            self._dash_colorbar.remove()
+            for ax in self._dash_axes:
+                ax.clear()
+        else:
+            # Create figure with subplots
+            fig = plt.figure(figsize=(22, 16))
+            
+            # Define grid for subplots
+            gs = fig.add_gridspec(3, 2, 
+                                hspace=0.5,
+                                wspace=0.4,
+                                height_ratios=[1.2, 1, 1],
+                                top=0.93,
+                                bottom=0.07)
+            
+            ax1 = fig.add_subplot(gs[0, :])
+            ax2 = fig.add_subplot(gs[1, 0])
+            ax3 = fig.add_subplot(gs[1, 1])
+            ax4 = fig.add_subplot(gs[2, 0])
+            ax5 = fig.add_subplot(gs[2, 1])
+            self._dash_fig = fig
+            self._dash_axes = (ax1, ax2, ax3, ax4, ax5)
         
         # Bar Chart
-        ax1 = fig.add_subplot(gs[0, :])
         self._create_score_comparison_subplot(ax1)
         
         # Distribution Histogram
-        ax2 = fig.add_subplot(gs[1, 0])
         self._create_score_distribution_subplot(ax2)
         
         # Severity shift Pie Chart
-        ax3 = fig.add_subplot(gs[1, 1])
         self._create_severity_shifts_subplot(ax3)
         
         # Scatter graph
-        ax4 = fig.add_subplot(gs[2, 0])
-        self._create_scatter_correlation_subplot(ax4)
+        self._dash_colorbar = self._create_scatter_correlation_subplot(ax4)
         
         # Statistics
-        ax5 = fig.add_subplot(gs[2, 1])
         self._create_statistics_subplot(ax5)
 
         fig.suptitle('Vulnerability Scoring System Comparison Dashboard', 
                     fontsize=24, 
                     y=0.98)
         
-        plt.subplots_adjust(top=0.95, bottom=0.07, hspace=0.5, wspace=0.4)
+        fig.subplots_adjust(top=0.95, bottom=0.07, hspace=0.5, wspace=0.4)
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=dpi, bbox_inches=bbox_inches)
             
         return fig
 
+    def render_all(self, output_dir='.', dpi=300, bbox_inches='tight'):
+        """
+        Save every standard chart and the dashboard into output_dir.
+        
+        All charts share the cached score arrays and analysis, and the
+        standalone figures are closed once saved.
+        
+        Parameters:
+        - output_dir: Directory to write the PNG files to
+        - dpi, bbox_inches: Passed to savefig for every chart
+        
+        Returns:
+        - Dashboard figure, or None if there are no results
+        """
+        if not self.comparator.results:
+            print("No results available for visualisation")
+            return
+        
+        charts = (
+            (self.plot_score_comparison, 'score_comparison.png'),
+            (self.plot_score_distribution, 'score_distribution.png'),
+            (self.plot_severity_shifts, 'severity_shifts.png'),
+            (self.plot_scatter_correlation, 'score_correlation.png'),
+        )
+        for plot, filename in charts:
+            fig, _ = plot(os.path.join(output_dir, filename), dpi=dpi, bbox_inches=bbox_inches)
+            plt.close(fig)
+        return self.create_dashboard(os.path.join(output_dir, 'dashboard.png'), dpi=dpi, bbox_inches=bbox_inches)
+
+    def _draw_severity_thresholds(self, ax, horizontal=False, vertical=False, alpha=0.5):
+        """Draw the Critical/High/Medium score thresholds as dashed lines."""
+        style = {'linestyle': '--', 'color': 'gray', 'alpha': alpha}
+        if horizontal:
+            for score in self._SEVERITY_THRESHOLDS:
+                ax.axhline(y=score, **style)
+        if vertical:
+            for score in self._SEVERITY_THRESHOLDS:
+                ax.axvline(x=score, **style)
+
+    def _draw_score_histograms(self, ax, cvss_scores, ivss_scores):
+        """Draw overlaid CVSS and IVSS histograms over 1-point bins from 0 to 10."""
+        edges = self._HISTOGRAM_EDGES
+        centres = (edges[:-1] + edges[1:]) / 2
+        widths = np.diff(edges)
+        for scores, label in ((cvss_scores, 'CVSS'), (ivss_scores, 'IVSS')):
+            counts, _ = np.histogram(scores, bins=edges)
+            ax.bar(centres, counts, widths, alpha=0.5, label=label, color=self.colours[label.lower()])
+
+    def _draw_score_bars(self, ax, x, bar_width, cvss_scores, ivss_scores):
+        """Draw grouped CVSS and IVSS bars in a single bar call, with legend."""
+        colours = [self.colours['cvss']] * len(x) + [self.colours['ivss']] * len(x)
+        ax.bar(np.concatenate([x - bar_width/2, x + bar_width/2]),
+               np.concatenate([cvss_scores, ivss_scores]),
+               bar_width, color=colours, alpha=0.8)
+        ax.legend(handles=[Patch(facecolor=self.colours['cvss'], alpha=0.8, label='CVSS'),
+                           Patch(facecolor=self.colours['ivss'], alpha=0.8, label='IVSS')])
+
     def _create_score_comparison_subplot(self, ax):
         """Create score comparison bar chart subplot."""
         # Extract data
-        vulnerability_ids = [r['id'] for r in self.comparator.results]
-        cvss_scores = [r['cvss']['score'] for r in self.comparator.results]
-        ivss_scores = [r['ivss']['score'] for r in self.comparator.results]
+        vulnerability_ids, cvss_scores, ivss_scores = self._get_arrays()
 
         # Plot
         bar_width = 0.35
 
         x = np.arange(len(vulnerability_ids))
         
-        ax.bar(x - bar_width/2, cvss_scores, bar_width, label='CVSS', color=self.colours['cvss'], alpha=0.8)
-        ax.bar(x + bar_width/2, ivss_scores, bar_width, label='IVSS', color=self.colours['ivss'], alpha=0.8)
+        self._draw_score_bars(ax, x, bar_width, cvss_scores, ivss_scores)
         
         ax.set_xlabel('Vulnerability ID', fontweight='bold')
         ax.set_ylabel('Score', fontweight='bold')
         ax.set_title('CVSS vs IVSS Score Comparison', fontweight='bold')
         ax.set_xticks(x)
         ax.set_xticklabels(vulnerability_ids, rotation=45, ha='right')
-        ax.legend()
         
-        ax.axhline(y=9.0, linestyle='--', color='gray', alpha=0.5, label='Critical')
-        ax.axhline(y=7.0, linestyle='--', color='gray', alpha=0.5, label='High')
-        ax.axhline(y=4.0, linestyle='--', color='gray', alpha=0.5, label='Medium')
+        self._draw_severity_thresholds(ax, horizontal=True)
 
     def _create_score_distribution_subplot(self, ax):
         """Create score distribution histogram subplot."""
         # Extract data
-        cvss_scores = [r['cvss']['score'] for r in self.comparator.results]
-        ivss_scores = [r['ivss']['score'] for r in self.comparator.results]
-        ivss_scores = [min(s, 10.0) for s in ivss_scores]
+        _, cvss_scores, ivss_scores = self._get_arrays()
+        ivss_scores = np.minimum(ivss_scores, 10.0)
         
         # Plot
-        bins = np.linspace(0, 10, 11)  # 0-10 range with 1-point bins
-        ax.hist(cvss_scores, bins=bins, alpha=0.5, label='CVSS', color=self.colours['cvss'])
-        ax.hist(ivss_scores, bins=bins, alpha=0.5, label='IVSS', color=self.colours['ivss'])
+        self._draw_score_histograms(ax, cvss_scores, ivss_scores)
         
-        ax.axvline(x=9.0, linestyle='--', color='gray', alpha=0.7)
-        ax.axvline(x=7.0, linestyle='--', color='gray', alpha=0.7)
-        ax.axvline(x=4.0, linestyle='--', color='gray', alpha=0.7)
+        self._draw_severity_thresholds(ax, vertical=True, alpha=0.7)
         
         ax.set_xlabel('Score', fontweight='bold')
         ax.set_ylabel('Frequency', fontweight='bold')
@@ -320,7 +401,7 @@ class VulnerabilityVisualisation:
             labels = list(shifts.keys())
             sizes = list(shifts.values())
 
-            colours = plt.cm.Paired(np.linspace(0, 1, len(labels)))
+            colours = self._PAIRED(np.linspace(0, 1, len(labels)))
             
             wedges, texts, autotexts = ax.pie(
                 sizes, 
@@ -343,24 +424,23 @@ class VulnerabilityVisualisation:
         ax.set_title('Severity Category Shifts', fontweight='bold')
 
     def _create_scatter_correlation_subplot(self, ax):
-        """Create scatter correlation subplot."""
+        """Create scatter correlation subplot, returning its colourbar."""
         # Extract data
-        cvss_scores = [r['cvss']['score'] for r in self.comparator.results]
-        ivss_scores = [r['ivss']['score'] for r in self.comparator.results]
+        _, cvss_scores, ivss_scores = self._get_arrays()
         
         # Plot
         scatter = ax.scatter(
             cvss_scores, 
             ivss_scores, 
-            c=np.abs(np.array(cvss_scores) - np.array(ivss_scores)), 
-            cmap='coolwarm',
+            c=np.abs(cvss_scores - ivss_scores), 
+            cmap=self._COOLWARM,
             s=80,
             alpha=0.7,
             edgecolors='darkgray',
             linewidths=0.5
         )
         
-        cbar = plt.colorbar(scatter, ax=ax)
+        cbar = ax.figure.colorbar(scatter, ax=ax)
         cbar.set_label('Score Difference', fontsize=10)
         
         ax.plot([0, 11], [0, 11], color='gray', linestyle='--', alpha=0.5)
@@ -374,13 +454,9 @@ class VulnerabilityVisualisation:
         ax.set_ylim(0, 11)
         
         ax.grid(True, linestyle='--', alpha=0.6)
-        ax.axhline(y=9.0, linestyle='--', color='gray', alpha=0.5)
-        ax.axhline(y=7.0, linestyle='--', color='gray', alpha=0.5)
-        ax.axhline(y=4.0, linestyle='--', color='gray', alpha=0.5)
+        self._draw_severity_thresholds(ax, horizontal=True, vertical=True)
         
-        ax.axvline(x=9.0, linestyle='--', color='gray', alpha=0.5)
-        ax.axvline(x=7.0, linestyle='--', color='gray', alpha=0.5)
-        ax.axvline(x=4.0, linestyle='--', color='gray', alpha=0.5)
+        return cbar
 
     def _create_statistics_subplot(self, ax):
         """Create statistics text box subplot."""
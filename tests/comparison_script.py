@@ -4,163 +4,157 @@ Comparison Script
 Script for comparing CVSS and IVSS vulnerability scoring systems.
 """
 
+import argparse
+import functools
+import hashlib
+import json
 import sys
 import os
-import matplotlib.pyplot as plt
+from dataclasses import dataclass
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from src.scoring.cvss_calculator import CVSSv4Calculator
 from src.scoring.ivss_extension import IVSSCalculator
 from src.utils.comparator import VulnerabilityComparator
-from src.utils.visualiser import VulnerabilityVisualisation
 
 
-def main():
+@dataclass(slots=True, frozen=True)
+class SampleVuln:
+    """Sample vulnerability with calculators parsed from its vector strings."""
+    id: str
+    description: str
+    cvss_calculator: CVSSv4Calculator
+    ivss_calculator: IVSSCalculator
+
+
+# Images written by render_all, and the hash of the results they were made from
+_RENDERED_FILES = ("score_comparison.png", "score_distribution.png", "severity_shifts.png",
+                   "score_correlation.png", "dashboard.png")
+_RENDER_CACHE_FILE = ".render_cache_key"
+
+# id, description and CVSS/IVSS vectors of each sample vulnerability
+_SAMPLES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'sample_vulns.json')
+
+
+def _render_cache_matches(cache_key):
+    """Whether every image exists and was rendered from results with this hash."""
+    if not all(os.path.exists(filename) for filename in _RENDERED_FILES):
+        return False
+    try:
+        with open(_RENDER_CACHE_FILE) as keyfile:
+            return keyfile.read() == cache_key
+    except FileNotFoundError:
+        return False
+
+
+def parse_args(argv=None):
+    """Parse the command line options of the comparison script."""
+    parser = argparse.ArgumentParser(description="Compare CVSS and IVSS scoring on sample vulnerabilities.")
+    parser.add_argument('--show', action='store_true', help="display the dashboard after saving it")
+    parser.add_argument('--force', action='store_true', help="re-render the charts even if the results are unchanged")
+    parser.add_argument('--pretty', action='store_true', help="export indented rather than compact JSON")
+    parser.add_argument('--no-plots', action='store_true', help="skip the charts and dashboard")
+    parser.add_argument('--dpi', type=int, default=300,
+                        help="resolution of the saved images (default: %(default)s; 72-100 renders much faster)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Run comparison of CVSS and IVSS on sample vulnerabilities."""
+    args = parse_args(argv)
     print("Running Vulnerability Scoring System Comparison...")
     
     # Create comparator
     comparator = VulnerabilityComparator()
     
-    # Load sample vulnerabilities and assess
+    # Load sample vulnerabilities and assess, reporting them in one write
+    lines = []
     for vuln in get_sample_vulnerabilities():
         result = comparator.assess_vulnerability(
-            vuln['id'], 
-            vuln['description'], 
-            vuln['cvss_params'], 
-            vuln['ivss_params']
+            vuln.id, 
+            vuln.description, 
+            vuln.cvss_calculator, 
+            vuln.ivss_calculator
         )
-        print(f"Assessed: {vuln['id']} - CVSS: {result['cvss']['score']:.1f}, IVSS: {result['ivss']['score']:.1f}")
+        lines.append(f"Assessed: {vuln.id} - CVSS: {result['cvss']['score']:.1f}, IVSS: {result['ivss']['score']:.1f}")
+    print("\n".join(lines))
     
     # Analyse results
     analysis = comparator.analyse_results()
-    print("\nAnalysis:")
-    print(f"Total vulnerabilities: {analysis['total_vulnerabilities']}")
-    print(f"Average CVSS score: {analysis['average_scores']['cvss']:.2f}")
-    print(f"Average IVSS score: {analysis['average_scores']['ivss']:.2f}")
-    print(f"Average difference: {analysis['average_scores']['difference']:.2f}")
-    print(f"Severity shifts: {analysis['severity_shifts']}")
+    print("\n".join([
+        "\nAnalysis:",
+        f"Total vulnerabilities: {analysis['total_vulnerabilities']}",
+        f"Average CVSS score: {analysis['average_scores']['cvss']:.2f}",
+        f"Average IVSS score: {analysis['average_scores']['ivss']:.2f}",
+        f"Average difference: {analysis['average_scores']['difference']:.2f}",
+        f"Severity shifts: {analysis['severity_shifts']}",
+    ]))
     
-    # Export results
-    comparator.export_results_to_json("vulnerability_comparison_results.json")
+    # Export results, compact unless --pretty asks for indented JSON
+    comparator.export_results_to_json("vulnerability_comparison_results.json",
+                                      indent=2 if args.pretty else None)
     print("\nResults exported to JSON file.")
     
-    # Create visualisations
+    if args.no_plots:
+        print("\nSkipping visualisations.")
+    else:
+        create_visualisations(comparator, args)
+    
+    print("\nAll tasks completed successfully.")
+
+def create_visualisations(comparator, args):
+    """
+    Render the charts and dashboard for the assessed results.
+    
+    matplotlib is imported here, so runs with --no-plots never load it.
+    """
+    # Skip rendering when the images were made from identical results;
+    # --force re-renders anyway, e.g. after changing the charts themselves
+    with open("vulnerability_comparison_results.json", 'rb') as jsonfile:
+        cache_key = hashlib.blake2b(jsonfile.read() + f"dpi={args.dpi}".encode()).hexdigest()
+    if not args.show and not args.force and _render_cache_matches(cache_key):
+        print("\nVisualisations are up to date, skipping render.")
+        return
+    
+    import matplotlib
+    # Only the dashboard window needs an interactive backend; saving uses Agg
+    if not args.show:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from src.utils.visualiser import VulnerabilityVisualisation
+    
     print("\nCreating visualisations...")
     visualiser = VulnerabilityVisualisation(comparator)
-    fig1, ax1 = visualiser.plot_score_comparison("score_comparison.png")
-    fig2, ax2 = visualiser.plot_score_distribution("score_distribution.png")
-    fig3, ax3 = visualiser.plot_severity_shifts("severity_shifts.png")
-    fig4, ax4 = visualiser.plot_scatter_correlation("score_correlation.png")
-    fig5 = visualiser.create_dashboard("dashboard.png")
+    dashboard = visualiser.render_all(dpi=args.dpi)
+    with open(_RENDER_CACHE_FILE, 'w') as keyfile:
+        keyfile.write(cache_key)
     print("Visualisation images saved.")
     
-    # Show dashboard (optional commenting)
-    plt.figure(fig5.number)
-    plt.show()
-    
-    print("\nAll tasks completed successfully.")
+    # Show dashboard when run with --show
+    if args.show:
+        plt.figure(dashboard.number)
+        plt.show()
+    plt.close(dashboard)
+
+@functools.lru_cache(maxsize=None)
+def _load_samples():
+    """Sample vulnerability records from the data file, read once per process."""
+    with open(_SAMPLES_FILE, 'rb') as samplefile:
+        return tuple(json.load(samplefile))
 
 def get_sample_vulnerabilities():
     """
-    Get list of sample vulnerabilities for testing comparison framework.
+    Yield sample vulnerabilities for testing comparison framework.
     These examples represent realistic industrial control system vulnerabilities.
+    Each one, and its calculators, is only built when it is reached. The
+    vector strings are read once per process, but every call parses fresh
+    calculators, since scoring writes to them.
     """
-    return [
-        # 1. PLC Firmware Buffer Overflow
-        {
-            'id': 'ICS-001',
-            'description': 'Buffer overflow vulnerability in PLC firmware allowing remote code execution',
-            'cvss_params': CVSSv4Calculator.from_vector_string(
-                "CVSS:4.0/AV:N/AC:L/AT:N/PR:N/UI:N/VC:H/VI:H/VA:H/SC:N/SI:N/SA:N"
-            ),
-            'ivss_params': IVSSCalculator.from_vector_string(
-                "IVSS:1.0/RC:C/BC:C/RL:W/EC:L/EX:F/AU:N/UI:N/AV:AR/LA:LN/CP:P/VI:P/MI:P/CI:P/PI:H/RI:H/SI:H/CD:H"
-            )
-        },
-        
-        # 2. HMI Authentication Bypass
-        {
-            'id': 'ICS-002',
-            'description': 'Authentication bypass vulnerability in HMI software allowing unauthorised access',
-            'cvss_params': CVSSv4Calculator.from_vector_string(
-                "CVSS:4.0/AV:N/AC:L/AT:N/PR:N/UI:N/VC:H/VI:H/VA:L/SC:N/SI:N/SA:N"
-            ),
-            'ivss_params': IVSSCalculator.from_vector_string(
-                "IVSS:1.0/RC:C/BC:C/RL:OF/EC:L/EX:POC/AU:N/UI:N/AV:LN/LA:LN/CP:D/VI:C/MI:P/CI:P/PI:M/RI:M/SI:L/CD:MH"
-            )
-        },
-        
-        # 3. Historian Database Information Disclosure
-        {
-            'id': 'ICS-003',
-            'description': 'Information disclosure vulnerability in historian database exposing sensitive process data',
-            'cvss_params': CVSSv4Calculator.from_vector_string(
-                "CVSS:4.0/AV:N/AC:H/AT:N/PR:L/UI:N/VC:H/VI:N/VA:N/SC:N/SI:N/SA:N"
-            ),
-            'ivss_params': IVSSCalculator.from_vector_string(
-                "IVSS:1.0/RC:C/BC:DM/RL:OF/EC:H/EX:POC/AU:U/UI:N/AV:LN/LA:LN/CP:C/VI:P/MI:P/CI:N/PI:L/RI:L/SI:N/CD:LM"
-            )
-        },
-        
-        # 4. RTU Denial of Service
-        {
-            'id': 'ICS-004',
-            'description': 'Denial of service vulnerability in RTU communication module causing major system unavailability',
-            'cvss_params': CVSSv4Calculator.from_vector_string(
-                "CVSS:4.0/AV:A/AC:L/AT:N/PR:N/UI:N/VC:N/VI:N/VA:H/SC:N/SI:N/SA:L"
-            ),
-            'ivss_params': IVSSCalculator.from_vector_string(
-                "IVSS:1.0/RC:C/BC:SD/RL:TF/EC:L/EX:F/AU:N/UI:N/AV:LN/LA:AR/CP:P/VI:P/MI:P/CI:P/PI:H/RI:H/SI:H/CD:H"
-            )
-        },
-        
-        # 5. SCADA Protocol Man in the Middle
-        {
-            'id': 'ICS-005',
-            'description': 'Man in the middle vulnerability over SCADA protocol allowing command injection',
-            'cvss_params': CVSSv4Calculator.from_vector_string(
-                "CVSS:4.0/AV:N/AC:H/AT:P/PR:N/UI:N/VC:L/VI:H/VA:L/SC:N/SI:L/SA:N"
-            ),
-            'ivss_params': IVSSCalculator.from_vector_string(
-                "IVSS:1.0/RC:C/BC:DM/RL:U/EC:H/EX:POC/AU:N/UI:N/AV:AR/LA:AR/CP:C/VI:P/MI:P/CI:P/PI:H/RI:H/SI:H/CD:H"
-            )
-        },
-        
-        # 6. Safety Instrumented System Firmware Vulnerability
-        {
-            'id': 'ICS-006',
-            'description': 'Critical vulnerability in safety instrumented system firmware affecting safety functions',
-            'cvss_params': CVSSv4Calculator.from_vector_string(
-                "CVSS:4.0/AV:L/AC:H/AT:N/PR:H/UI:N/VC:N/VI:H/VA:H/SC:N/SI:N/SA:N"
-            ),
-            'ivss_params': IVSSCalculator.from_vector_string(
-                "IVSS:1.0/RC:C/BC:C/RL:W/EC:H/EX:POC/AU:AR/UI:N/AV:LH/LA:LH/CP:C/VI:P/MI:P/CI:P/PI:H/RI:H/SI:H/CD:H"
-            )
-        },
-        
-        # 7. Engineering Workstation Credential Theft
-        {
-            'id': 'ICS-007',
-            'description': 'Credentials theft vulnerability in engineering workstation software',
-            'cvss_params': CVSSv4Calculator.from_vector_string(
-                "CVSS:4.0/AV:L/AC:L/AT:N/PR:L/UI:P/VC:H/VI:N/VA:N/SC:H/SI:N/SA:N"
-            ),
-            'ivss_params': IVSSCalculator.from_vector_string(
-                "IVSS:1.0/RC:C/BC:DM/RL:OF/EC:L/EX:F/AU:U/UI:Y/AV:LH/LA:LH/CP:P/VI:P/MI:P/CI:P/PI:M/RI:M/SI:L/CD:H"
-            )
-        },
-         # 8. Max Severity Test
-        {
-            'id': 'MAX-TEST',
-            'description': 'Test cases to evaluate maximum possible scores',
-            'cvss_params': CVSSv4Calculator.from_vector_string(
-                "CVSS:4.0/AV:N/AC:L/AT:N/PR:N/UI:N/VC:H/VI:H/VA:H/SC:H/SI:S/SA:S/E:A/CR:H/IR:H/AR:H"
-            ),
-            'ivss_params': IVSSCalculator.from_vector_string(
-                "IVSS:1.0/RC:C/BC:C/RL:U/EC:L/EX:F/AU:N/UI:N/AV:AR/LA:AR/CP:N/VI:C/MI:C/CI:C/PI:H/RI:H/SI:H/CD:H"
-            )
-        }
-    ]
+    for sample in _load_samples():
+        yield SampleVuln(
+            id=sample['id'],
+            description=sample['description'],
+            cvss_calculator=CVSSv4Calculator.from_vector_string(sample['cvss_vector']),
+            ivss_calculator=IVSSCalculator.from_vector_string(sample['ivss_vector'])
+        )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file